@@ -1,18 +1,17 @@
 import os
-import json
 import argparse
-from typing import List, Tuple, Optional, Callable
-from make_latex_group import make_latex_group
+from dataclasses import dataclass, field
+from typing import List, Optional, Callable
+from make_latex_group import make_latex_group, render_stroke_pngs
 from utils import write_latex_to_pdf
-from utils.search_words import search_words, load_words, print_statistics
+from utils.json_io import iter_json_items
+from utils.search_words import search_words, load_words_cached, print_statistics, generate_default_filename
 from utils.filters import (
-    filter_by_level,
-    filter_by_grammar,
-    filter_by_multiple_levels,
-    filter_by_custom,
-    filter_by_text,
-    filter_by_translation,
     appears_in_level,
+    has_lowest_level,
+    has_grammar,
+    appears_in_min_levels,
+    combine_predicates,
     apply_filters,
     sort_by_pinyin,
     sort_by_stroke_count,
@@ -21,51 +20,82 @@ from utils.filters import (
     apply_sort
 )
 
-def compile_pdf(entries: List[Tuple[str, str, str]], output_basename: str = "chinese_strokes", chars_per_page: int = 4):
+@dataclass
+class Entries:
+    """Character entries stored as parallel columns, one list per field."""
+    pinyin: List[str] = field(default_factory=list)
+    word: List[str] = field(default_factory=list)
+    translation: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.word)
+    
+    @classmethod
+    def from_words(cls, words: List[dict]) -> 'Entries':
+        """Build entries from word dictionaries, joining all translations with semicolons."""
+        return cls(
+            pinyin=[word['pinyin'] for word in words],
+            word=[word['chineseword'] for word in words],
+            translation=['; '.join(word['translations']) if word['translations'] else '' for word in words]
+        )
+
+# LaTeX document preamble
+LATEX_PREAMBLE = (
+    "\\documentclass{article}\n"
+    "\\usepackage{fontspec}\n"
+    "\\usepackage{xeCJK}\n"
+    "\n"
+    "% Fonts\n"
+    "\\setmainfont{Times New Roman}\n"  # Common system font
+    "\\setCJKmainfont{STSong}\n"  # Common Chinese font
+    "\n"
+    "\\usepackage[a4paper,margin=2cm]{geometry}\n"
+    "\\usepackage{parskip}\n"
+    "\\usepackage{tikz}\n"
+    "\\usetikzlibrary{chains}\n"
+    "\n"
+    "\\begin{document}\n"
+)
+
+# LaTeX document end
+LATEX_END = "\\end{document}"
+
+def compile_pdf(entries: Entries, output_basename: str = "chinese_strokes", chars_per_page: int = 4,
+                syntax_check: bool = False):
     """
     Compile a list of character entries into a PDF with stroke sequences.
     
     Args:
-        entries: List of tuples containing (pinyin, character, translations)
+        entries: Entries with the pinyin, characters and translations of each word
         output_basename: Base name for the output PDF file
         chars_per_page: Number of characters to show per page
+        syntax_check: Only check the LaTeX for errors; no PNGs are rendered and no PDF is written
     """
-    latex_entries = []
-    
-    # Add LaTeX document preamble
-    latex_entries.append(
-        "\\documentclass{article}\n"
-        "\\usepackage{fontspec}\n"
-        "\\usepackage{xeCJK}\n"
-        "\n"
-        "% Fonts\n"
-        "\\setmainfont{Times New Roman}\n"  # Common system font
-        "\\setCJKmainfont{STSong}\n"  # Common Chinese font
-        "\n"
-        "\\usepackage[a4paper,margin=2cm]{geometry}\n"
-        "\\usepackage{parskip}\n"
-        "\\usepackage{tikz}\n"
-        "\\usetikzlibrary{chains}\n"
-        "\n"
-        "\\begin{document}\n"
-    )
+    # Render all stroke PNGs up front in parallel, the LaTeX loop below only reads them.
+    # A syntax check skips rendering, stroke sequences then only include PNGs that already exist.
+    if not syntax_check:
+        render_stroke_pngs(entries.word)
     
-    # Generate LaTeX for each entry
-    for i, (pinyin, word, translations) in enumerate(entries):
-        latex_entries.append(make_latex_group(pinyin, word, translations))
+    def write_document(out) -> None:
+        # Stream the document into the .tex file, blocks are separated by blank lines
+        out.write(LATEX_PREAMBLE)
         
-        # Add page break after every chars_per_page entries (except for the last page)
-        if (i + 1) % chars_per_page == 0 and i < len(entries) - 1:
-            latex_entries.append("\\pagebreak")
-    
-    # Add document end
-    latex_entries.append("\\end{document}")
-    
-    # Combine all LaTeX code
-    full_latex = "\n\n".join(latex_entries)
+        # Generate LaTeX page by page, with chars_per_page entries on each page
+        for page_start in range(0, len(entries), chars_per_page):
+            # Add page break between pages
+            if page_start:
+                out.write("\n\n\\pagebreak")
+            
+            for i in range(page_start, min(page_start + chars_per_page, len(entries))):
+                out.write("\n\n")
+                out.write(make_latex_group(entries.pinyin[i], entries.word[i], entries.translation[i], render=False))
+        
+        # Add document end
+        out.write("\n\n")
+        out.write(LATEX_END)
     
     # Write and compile PDF
-    write_latex_to_pdf(full_latex, output_basename)
+    write_latex_to_pdf(write_document, output_basename, syntax_check)
 
 def load_entries_from_json(
     json_path: str,
@@ -74,7 +104,7 @@ def load_entries_from_json(
     grammar_filter: Optional[str] = None,
     min_levels: Optional[int] = None,
     custom_filter: Optional[Callable[[dict], bool]] = None
-) -> List[Tuple[str, str, str]]:
+) -> Entries:
     """
     Load entries from a JSON file containing word dictionaries.
     
@@ -87,114 +117,46 @@ def load_entries_from_json(
         custom_filter: Custom filter function
         
     Returns:
-        List of tuples (pinyin, character, translations)
+        Entries with the pinyin, characters and translations of the loaded words
     """
-    with open(json_path, 'r', encoding='utf-8') as f:
-        words = json.load(f)
-    
-    # Build list of filters to apply
-    filters = []
+    # Build list of predicates and combine them so each word is checked in a single pass
+    predicates = []
     if level_filter:
-        filters.append(lambda w: filter_by_level(w, level_filter))
+        predicates.append(has_lowest_level(level_filter))
     if grammar_filter:
-        filters.append(lambda w: filter_by_grammar(w, grammar_filter))
+        predicates.append(has_grammar(grammar_filter))
     if min_levels:
-        filters.append(lambda w: filter_by_multiple_levels(w, min_levels))
+        predicates.append(appears_in_min_levels(min_levels))
     if custom_filter:
-        filters.append(lambda w: filter_by_custom(w, custom_filter))
-    
-    # Apply filters
-    if filters:
-        words = apply_filters(words, filters)
+        predicates.append(custom_filter)
+    matches = combine_predicates(predicates)
     
-    # Apply cutoff after filtering
     if cutoff:
-        words = words[:cutoff]
-    
-    # Convert to entry format
-    entries = []
-    for word in words:
-        # Join all translations with semicolons
-        translations = '; '.join(word['translations']) if word['translations'] else ''
-        entry = (
-            word['pinyin'],
-            word['chineseword'],
-            translations
-        )
-        entries.append(entry)
-    
-    return entries
-
-def filter_by_text(words: List[dict], field: str, query: str, normalize: bool = False) -> List[dict]:
-    """
-    Filter words by text content in a specific field.
-    
-    Args:
-        words: List of word dictionaries
-        field: Field to search in (e.g., 'chineseword', 'pinyin')
-        query: Text to search for
-        normalize: Whether to normalize pinyin (remove tone marks) before comparison
-        
-    Returns:
-        Filtered list of words
-    """
-    query = query.lower()
-    if normalize and field == 'pinyin':
-        query = normalize_pinyin(query)
-        print(f"Normalized query: {query}")
-    
-    def matches(word: dict) -> bool:
-        field_value = word.get(field, '').lower()
-        if normalize and field == 'pinyin':
-            field_value = normalize_pinyin(field_value)
-            print(f"Word: {word.get('chineseword')}, Original pinyin: {word.get('pinyin')}, Normalized: {field_value}")
-        return query in field_value
-    
-    return filter_by_custom(words, matches)
-
-def generate_default_filename(args: argparse.Namespace) -> str:
-    """
-    Generate a descriptive default filename based on the filters and cutoff.
-    
-    Args:
-        args: Parsed command line arguments
+        # Stream the words and stop as soon as enough of them passed the filters
+        words = []
+        for word in iter_json_items(json_path):
+            if not matches(word):
+                continue
+            words.append(word)
+            if len(words) == cutoff:
+                break
+    else:
+        words = load_words_cached(json_path)
         
-    Returns:
-        Descriptive filename without extension
-    """
-    parts = []
+        # Apply filters
+        if predicates:
+            words = [word for word in words if matches(word)]
     
-    # Add search filters
-    if args.pinyin:
-        parts.append(f"pinyin_{args.pinyin}")
-    if args.character:
-        parts.append(f"character_{args.character}")
-    if args.translation:
-        parts.append(f"translation_{args.translation}")
-    if args.grammar:
-        parts.append(f"grammar_{args.grammar}")
-    if args.level:
-        parts.append(f"level_{args.level}")
-    if args.appears_in:
-        parts.append(f"appears_in_{args.appears_in}")
-    if args.min_levels:
-        parts.append(f"min_levels_{args.min_levels}")
-        
-    # Add exact flag if used
-    if args.exact:
-        parts.append("exact")
-        
-    # If no filters were used, use a default name
-    if not parts:
-        return "output"
-        
-    return f"output_{'_'.join(parts)}"
+    # Convert to entry format
+    return Entries.from_words(words)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Generate PDF with Chinese character stroke sequences')
     parser.add_argument('--cutoff', type=int, help='Number of words to process (default: all)')
     parser.add_argument('--output', type=str, help='Output PDF basename (default: auto-generated from filters)')
     parser.add_argument('--chars-per-page', type=int, default=4, help='Number of characters per page')
+    parser.add_argument('--syntax-check', action='store_true',
+                      help='Only check the generated LaTeX for errors (no PNG rendering, no PDF)')
     
     # Search filters
     parser.add_argument('--pinyin', help='Filter by pinyin (can be partial match)')
@@ -228,7 +190,7 @@ if __name__ == "__main__":
     print(f"Loading words from {json_path}")
     
     # Load words
-    words = load_words(json_path)
+    words = load_words_cached(json_path)
     if not words:
         exit(1)
         
@@ -249,7 +211,7 @@ if __name__ == "__main__":
     if args.appears_in:
         filters.append(appears_in_level(args.appears_in))
     if args.min_levels:
-        filters.append(lambda w: filter_by_multiple_levels(w, args.min_levels))
+        filters.append(appears_in_min_levels(args.min_levels))
         
     # Apply additional filters
     if filters:
@@ -276,15 +238,7 @@ if __name__ == "__main__":
             exit(0)
             
     # Convert to entry format
-    entries = []
-    for word in words:
-        translations = '; '.join(word['translations']) if word['translations'] else ''
-        entry = (
-            word['pinyin'],
-            word['chineseword'],
-            translations
-        )
-        entries.append(entry)
+    entries = Entries.from_words(words)
     
     print(f"Processing {len(entries)} words...")
     
@@ -298,5 +252,6 @@ if __name__ == "__main__":
     if args.cutoff:
         output_name = f"{output_name}_{len(entries)}"
         
-    compile_pdf(entries, output_name, args.chars_per_page)
-    print(f"PDF generated: {output_name}.pdf") 
\ No newline at end of file
+    compile_pdf(entries, output_name, args.chars_per_page, args.syntax_check)
+    if not args.syntax_check:
+        print(f"PDF generated: {output_name}.pdf") 
\ No newline at end of file
@@ -1,38 +1,37 @@
-from bs4 import BeautifulSoup
+from lxml import etree
 import os
 import subprocess
 
-def generate_stroke_step_pngs(svg_path: str, output_prefix: str, output_dir: str):
-    # Use absolute path to avoid any confusion with Inkscape's behavior
-    png_dir = os.path.abspath(os.path.join(output_dir, "pngs"))
-    os.makedirs(png_dir, exist_ok=True)
+# Opening and closing markup shared by every step SVG
+SVG_HEADER = (
+    b"<?xml version='1.0' encoding='utf-8'?>\n"
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="109" height="109" viewBox="0 0 109 109">'
+)
+SVG_FOOTER = b"</svg>"
 
-    # Read the SVG file
-    with open(svg_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "xml")
+# Output directories already created during this run
+_created_dirs = set()
 
-    # Remove all stroke number labels (text)
-    for text in soup.find_all("text"):
-        text.decompose()
+def _path_markup(path, style: str) -> bytes:
+    """Serialize a path, keeping only its outline and the given style."""
+    return etree.tostring(etree.Element("path", d=path.get("d", ""), style=style))
 
-    # Remove any mirrored transforms like scale(-1, ...)
-    for g in soup.find_all("g"):
-        if g.has_attr("transform") and "scale(-1" in g["transform"]:
-            del g["transform"]
+def generate_stroke_step_pngs(svg_path: str, output_prefix: str, output_dir: str, debug: bool = False):
+    # Use absolute path to avoid any confusion with Inkscape's behavior
+    png_dir = os.path.abspath(os.path.join(output_dir, "pngs"))
+    if png_dir not in _created_dirs:
+        os.makedirs(png_dir, exist_ok=True)
+        _created_dirs.add(png_dir)
 
-    # Collect all stroke paths and force them to black
-    all_strokes = soup.find_all("path")
-    for path in all_strokes:
-        path.attrs = {}
-        path["style"] = "fill:none;stroke:#000000;stroke-width:3"
+    # Parse the SVG file once; stroke number labels and mirrored groups are
+    # left behind because only the path outlines are copied into the steps
+    tree = etree.parse(svg_path)
+    all_strokes = list(tree.iter("{*}path"))
 
-    # Build gray background stroke set
-    gray_paths = []
-    for path in all_strokes:
-        gray_path = BeautifulSoup(str(path), "xml").find("path")
-        gray_path.attrs = {}
-        gray_path["style"] = "fill:none;stroke:#CCCCCC;stroke-width:3"
-        gray_paths.append(gray_path)
+    # Serialize the gray background and each black stroke once; every step
+    # is then put together from these pieces without building an XML tree
+    gray_markup = b"".join(_path_markup(path, "fill:none;stroke:#CCCCCC;stroke-width:3") for path in all_strokes)
+    black_markup = [_path_markup(path, "fill:none;stroke:#000000;stroke-width:3") for path in all_strokes]
 
     for i in range(1, len(all_strokes) + 1):
         step_svg_path = os.path.join(png_dir, f"{output_prefix}_step_{i:02d}.svg")
@@ -41,41 +40,25 @@ def generate_stroke_step_pngs(svg_path: str, output_prefix: str, output_dir: str
         if os.path.exists(step_png_path):
             continue  # Skip if already rendered
 
-        # Create a new SVG document
-        step_soup = BeautifulSoup(
-            '<svg xmlns="http://www.w3.org/2000/svg" width="109" height="109" viewBox="0 0 109 109"></svg>',
-            "xml"
-        )
-        svg_root = step_soup.svg
-
-        # Add background gray strokes
-        for gp in gray_paths:
-            svg_root.append(gp)
-
-        # Add black strokes up to step i
-        for j in range(i):
-            black_path = BeautifulSoup(str(all_strokes[j]), "xml").find("path")
-            black_path.attrs = {}
-            black_path["style"] = "fill:none;stroke:#000000;stroke-width:3"
-            svg_root.append(black_path)
-
-        # Write the step SVG to disk
-        with open(step_svg_path, "w", encoding="utf-8") as out_svg:
-            out_svg.write(str(step_soup))
+        # Gray background strokes, then black strokes up to step i
+        svg_bytes = SVG_HEADER + gray_markup + b"".join(black_markup[:i]) + SVG_FOOTER
 
-        # Convert SVG to PNG using Inkscape with absolute paths
-        step_svg_path = os.path.abspath(step_svg_path)
-        step_png_path = os.path.abspath(step_png_path)
+        # Only keep the intermediate step SVG on disk when debugging
+        if debug:
+            with open(step_svg_path, "wb") as out_svg:
+                out_svg.write(svg_bytes)
 
+        # Convert SVG to PNG using Inkscape, feeding the SVG through stdin;
+        # the paths are already absolute since png_dir is
         print(f"🔄 Rendering: {step_png_path}")
 
         subprocess.run([
             "inkscape",
-            step_svg_path,
+            "--pipe",
             "--export-type=png",
             "--export-area-drawing",
             "--export-width=300",
             f"--export-filename={step_png_path}"
-        ], check=True)
+        ], input=svg_bytes, check=True)
 
-        print(f"✅ Created: {step_png_path}")
\ No newline at end of file
+        print(f"✅ Created: {step_png_path}")
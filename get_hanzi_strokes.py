@@ -6,14 +6,18 @@ def get_hanzi_stroke_svgs(word: str) -> list[str]:
     For a given Chinese word, return a list of stroke SVG filenames
     in the format generated by Make Me A Hanzi: 'XXXXX-still.svg'
     """
-    return [f"{ord(char)}-still.svg" for char in word]
+    return list(map("{}-still.svg".format, map(ord, word)))
 
 def generate_latex_stroke_sequence(char_label: str, output_dir: str) -> str:
     steps = []
     png_dir = os.path.join(output_dir, "pngs")
+    # List the directory once instead of checking each step file
+    try:
+        png_names = set(os.listdir(png_dir))
+    except FileNotFoundError:
+        png_names = set()
     for i in range(1, 30):
-        step_path = os.path.join(png_dir, f"{char_label}_step_{i:02d}.png")
-        if not os.path.exists(step_path):
+        if f"{char_label}_step_{i:02d}.png" not in png_names:
             break
         steps.append(rf"\includegraphics[width=0.12\linewidth]{{pngs/{char_label}_step_{i:02d}.png}}")
     return "\n".join(steps)
@@ -1,12 +1,66 @@
 import os
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
 from utils import (
     get_hanzi_stroke_svgs,
     generate_stroke_step_pngs,
     generate_latex_stroke_sequence,
     generate_latex_header
 )
+from utils.get_hanzi_stroke_svgs import SVG_BASE_PATH
 
-def make_latex_group(pinyin: str, word: str, translation: str) -> str:
+PNG_OUTPUT_DIR = "output/pngs"
+
+# Header followed by the stroke sequences of each character
+_GROUP_TEMPLATE = "{header}\n\n{sequences}"
+
+def _stroke_svgs(word: str) -> list[tuple[str, str]]:
+    """Get (character, SVG path) pairs for each character in the word."""
+    pairs = []
+    for svg_file in get_hanzi_stroke_svgs(word):
+        codepoint = int(svg_file.split('-')[0])
+        pairs.append((chr(codepoint), os.path.join(SVG_BASE_PATH, svg_file)))
+    return pairs
+
+def render_stroke_pngs(words: Iterable[str], max_workers: Optional[int] = None) -> None:
+    """
+    Render the stroke step PNGs for every character in the given words in parallel.
+    
+    Each character is rendered once, in one of the worker processes; characters
+    are handed out in chunks of four to cut down on inter-process round trips.
+    
+    Args:
+        words: The Chinese words whose characters should be rendered
+        max_workers: Number of worker processes (default: number of CPUs)
+    """
+    os.makedirs(PNG_OUTPUT_DIR, exist_ok=True)
+    
+    svg_paths = {}
+    for word in words:
+        for hanzi_char, svg_path in _stroke_svgs(word):
+            svg_paths.setdefault(hanzi_char, svg_path)
+    
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        # Characters are already spread over the workers, so each renders its own steps serially
+        render_char = functools.partial(generate_stroke_step_pngs, max_workers=1)
+        # Consume the results so that errors from the workers are raised here
+        list(executor.map(render_char, svg_paths.values(), svg_paths.keys(), chunksize=4))
+
+@functools.lru_cache(maxsize=None)
+def _per_char_latex(hanzi_char: str, svg_path: str, render: bool = True) -> str:
+    """
+    Render the stroke steps of a single character and return its LaTeX stroke sequence.
+    
+    Cached per character so that characters shared between entries are only processed once.
+    """
+    if render:
+        # The renderer knows the stroke count, so the PNG directory doesn't have to be checked
+        total_strokes = generate_stroke_step_pngs(svg_path, hanzi_char)
+        return generate_latex_stroke_sequence(hanzi_char, total_strokes)
+    return generate_latex_stroke_sequence(hanzi_char)
+
+def make_latex_group(pinyin: str, word: str, translation: str, render: bool = True) -> str:
     """
     Generate LaTeX code for a character group including stroke sequences.
     
@@ -14,26 +68,18 @@ def make_latex_group(pinyin: str, word: str, translation: str) -> str:
         pinyin: The pinyin pronunciation of the character
         word: The Chinese character(s)
         translation: The translation of the character
+        render: Whether to render missing stroke PNGs (False when they were rendered beforehand)
     Returns:
         str: LaTeX code for the character group
     """
-    latex_entries = []
-    svg_base_path = "makemeahanzi/svgs-still"
-    output_dir = "output/pngs"
-    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(PNG_OUTPUT_DIR, exist_ok=True)
 
     # Generate header
     header_latex = generate_latex_header(pinyin, word, translation)
-    latex_entries.append(header_latex)
 
     # Generate stroke sequences
-    for svg_file in get_hanzi_stroke_svgs(word):
-        codepoint = int(svg_file.split('-')[0])
-        hanzi_char = chr(codepoint)
-        svg_path = os.path.join(svg_base_path, svg_file)
-
-        generate_stroke_step_pngs(svg_path, hanzi_char)
-        latex_code = generate_latex_stroke_sequence(hanzi_char)
-        latex_entries.append(latex_code)
+    sequences = [_per_char_latex(hanzi_char, svg_path, render) for hanzi_char, svg_path in _stroke_svgs(word)]
+    if not sequences:
+        return header_latex
 
-    return "\n\n".join(latex_entries)
\ No newline at end of file
+    return _GROUP_TEMPLATE.format(header=header_latex, sequences="\n\n".join(sequences))
@@ -1,11 +1,28 @@
 import os
 import subprocess
 
+# Commands whose output is only correct after a second xelatex run
+RERUN_COMMANDS = ("\\ref", "\\pageref", "\\cite", "\\tableofcontents")
+
+def needs_second_run(tex_file: str) -> bool:
+    """Check whether the document uses cross-references that need a second xelatex run."""
+    base_name = tex_file.rsplit('.', 1)[0]
+    try:
+        with open(base_name + '.log', "r", encoding="utf-8", errors="replace") as f:
+            if "Rerun to get" in f.read():
+                return True
+    except FileNotFoundError:
+        pass
+    
+    with open(tex_file, "r", encoding="utf-8") as f:
+        source = f.read()
+    return any(command in source for command in RERUN_COMMANDS)
+
 def compile_latex(tex_file: str) -> None:
     """Compile a LaTeX file using xelatex."""
     try:
-        # Run xelatex twice to ensure proper compilation
-        for _ in range(2):
+        # Run xelatex a second time only when references have to be resolved
+        for run in range(2):
             result = subprocess.run(
                 ["xelatex", "-interaction=nonstopmode", tex_file],
                 stdout=subprocess.PIPE,
@@ -18,6 +35,9 @@ def compile_latex(tex_file: str) -> None:
                 print(result.stderr)
                 return
             
+            if run == 0 and not needs_second_run(tex_file):
+                break
+            
         print(f"✅ Successfully compiled {tex_file}")
         
         # Clean up auxiliary files
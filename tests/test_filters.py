@@ -0,0 +1,69 @@
+import unittest
+from utils.filters import (
+    normalize_pinyin,
+    filter_by_text,
+    filter_by_grammar,
+    filter_by_level,
+    apply_filters,
+    as_predicate,
+    contains_text,
+    has_grammar,
+)
+
+class TestFilters(unittest.TestCase):
+    def test_normalize_pinyin_strips_tones(self):
+        test_cases = [
+            ('nǐ hǎo', 'ni hao'),
+            ('lǜsè', 'luse'),
+            ('Běijīng', 'Beijing'),
+            ('nü3', 'nu3'),
+            ('zhōngwén', 'zhongwen'),
+        ]
+        for pinyin, expected in test_cases:
+            with self.subTest(pinyin=pinyin):
+                self.assertEqual(normalize_pinyin(pinyin), expected)
+
+    def test_normalize_pinyin_decomposed_input(self):
+        # Tone marks written as combining characters are removed as well
+        self.assertEqual(normalize_pinyin('mā má'), 'ma ma')
+
+    def test_normalize_pinyin_leaves_plain_text(self):
+        self.assertEqual(normalize_pinyin('pinyin 中文'), 'pinyin 中文')
+
+    def test_filter_by_text_normalized(self):
+        words = [{'pinyin': 'nǐ hǎo'}, {'pinyin': 'zàijiàn'}]
+        result = filter_by_text(words, 'pinyin', 'NI HAO', normalize=True)
+        self.assertEqual(result, [words[0]])
+
+    def test_filter_by_grammar_formats(self):
+        words = [{'grammar': g} for g in ['N', '(N)', 'N/V', '(N)/V', 'Nv', '(N', 'V']]
+        result = filter_by_grammar(words, 'n')
+        self.assertEqual([w['grammar'] for w in result], ['N', '(N)', 'N/V', '(N)/V'])
+
+    def test_apply_filters_single_pass(self):
+        words = [
+            {'pinyin': 'shì', 'grammar': 'V', 'lowest_level': 'beginner'},
+            {'pinyin': 'shí', 'grammar': 'N', 'lowest_level': 'beginner'},
+            {'pinyin': 'shǐ', 'grammar': 'V', 'lowest_level': 'advanced'},
+            {'pinyin': 'mā', 'grammar': 'V', 'lowest_level': 'beginner'},
+        ]
+        predicates = [
+            contains_text('pinyin', 'shi', normalize=True),
+            has_grammar('V'),
+            as_predicate(lambda ws: filter_by_level(ws, 'beginner')),
+        ]
+        self.assertEqual(apply_filters(words, predicates), [words[0]])
+
+    def test_apply_filters_stops_at_first_failing_predicate(self):
+        words = [{'grammar': 'V'}, {'grammar': 'N'}, {'grammar': 'V'}]
+        checked = []
+        def record(word):
+            checked.append(word)
+            return True
+        result = apply_filters(words, [has_grammar('V'), record])
+        self.assertEqual(result, [words[0], words[2]])
+        # The word rejected by the first predicate never reaches the second
+        self.assertEqual(checked, [words[0], words[2]])
+
+if __name__ == '__main__':
+    unittest.main()
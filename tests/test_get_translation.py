@@ -1,6 +1,16 @@
 import unittest
 from utils.get_translation import lookup
 
+def _lowered_blob(translations):
+    """Join the translations into one lowercased string for substring checks."""
+    # Newlines can't appear in an expected meaning, so matches never span two translations
+    return '\n'.join(translations).lower()
+
+def _count_found(expected, translations):
+    """Count how many of the expected meanings appear in any of the translations."""
+    blob = _lowered_blob(translations)
+    return sum(meaning.lower() in blob for meaning in expected)
+
 class TestTranslation(unittest.TestCase):
     def test_multiple_meanings(self):
         # Test words known to have multiple meanings
@@ -18,10 +28,7 @@ class TestTranslation(unittest.TestCase):
                 self.assertGreater(len(translations), 1, 
                     f"Expected multiple translations for '{word}', but got: {translations}")
                 # Check that we got at least some of the expected meanings
-                found_meanings = 0
-                for meaning in expected_meanings:
-                    if any(meaning.lower() in trans.lower() for trans in translations):
-                        found_meanings += 1
+                found_meanings = _count_found(expected_meanings, translations)
                 self.assertGreater(found_meanings, 0,
                     f"Expected to find at least one of {expected_meanings} in translations for '{word}', but got: {translations}")
 
@@ -30,10 +37,7 @@ class TestTranslation(unittest.TestCase):
         translations = lookup('大')
         self.assertGreater(len(translations), 1)
         expected = ['big', 'large', 'great']
-        found_meanings = 0
-        for meaning in expected:
-            if any(meaning.lower() in trans.lower() for trans in translations):
-                found_meanings += 1
+        found_meanings = _count_found(expected, translations)
         self.assertGreater(found_meanings, 0,
             f"Expected to find at least one of {expected} in translations, but got: {translations}")
 
@@ -50,7 +54,7 @@ class TestTranslation(unittest.TestCase):
                 translations = lookup(char)
                 self.assertTrue(len(translations) > 0, f"No translations found for {char}")
                 # Check if expected substring appears in any of the translations
-                found = any(expected_substr.lower() in trans.lower() for trans in translations)
+                found = expected_substr.lower() in _lowered_blob(translations)
                 self.assertTrue(found, f"Expected '{expected_substr}' in translations of {char}")
 
     def test_empty_input(self):
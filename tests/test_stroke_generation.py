@@ -1,8 +1,10 @@
+import functools
 import os
 import subprocess
-from bs4 import BeautifulSoup
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from lxml import etree
 
 # Add the project root to the Python path
 project_root = str(Path(__file__).parent.parent)
@@ -10,19 +12,19 @@ sys.path.append(project_root)
 
 from utils import get_hanzi_stroke_svgs, generate_stroke_step_pngs
 
+# Every stroke path carries a class="strokeN" attribute; matching on
+# local-name() works whether or not the SVG declares a namespace
+STROKE_PATHS = etree.XPath('//*[local-name()="path" and starts-with(@class, "stroke")]')
+
 def analyze_svg_file(svg_path):
     """Analyze an SVG file to count strokes and check for potential issues."""
-    with open(svg_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "xml")
-    
-    # Find all paths with stroke classes
-    stroke_paths = []
-    for path in soup.find_all("path"):
-        stroke_class = path.get('class', '')
-        if stroke_class and isinstance(stroke_class, str) and stroke_class.startswith('stroke'):
-            stroke_paths.append(path)
-    
-    return len(stroke_paths)
+    # The filter runs inside libxml2, only the matches come back to Python
+    tree = etree.parse(svg_path)
+    return len(STROKE_PATHS(tree))
+
+def scan_pngs(pngs_dir):
+    """Map every file in the PNG directory to its size with a single directory read."""
+    return {entry.name: entry.stat().st_size for entry in os.scandir(pngs_dir)}
 
 def test_stroke_generation():
     # Test a variety of characters with different stroke counts
@@ -37,6 +39,8 @@ def test_stroke_generation():
     # Base path for SVG files
     svg_base_path = os.path.join(project_root, "makemeahanzi/svgs-still")
     
+    # Collect every character's SVG and stroke count first
+    characters = []
     for char in test_chars:
         print(f"\nTesting character: {char}")
         
@@ -56,44 +60,54 @@ def test_stroke_generation():
             # Analyze original SVG
             num_strokes = analyze_svg_file(svg_path)
             print(f"Number of strokes in original SVG: {num_strokes}")
-            
-            # Check if all PNGs already exist
-            all_pngs_exist = True
-            for i in range(1, num_strokes + 1):
-                png_path = os.path.join(pngs_dir, f"{hanzi_char}_step_{i:02d}.png")
-                if not os.path.exists(png_path) or os.path.getsize(png_path) == 0:
-                    all_pngs_exist = False
-                    break
-            
-            if all_pngs_exist:
-                print(f"⏩ All PNGs for {hanzi_char} already exist, skipping generation")
-            else:
-                # Generate stroke steps
-                generate_stroke_step_pngs(svg_path, hanzi_char)
-            
-            # Verify each step
-            step = 1
-            while True:
-                png_path = os.path.join(pngs_dir, f"{hanzi_char}_step_{step:02d}.png")
-                if not os.path.exists(png_path):
-                    break
-                    
-                # Check if the PNG exists and is valid
-                if os.path.getsize(png_path) == 0:
-                    print(f"❌ Step {step}: Empty PNG file")
-                else:
-                    print(f"✅ Step {step}: PNG exists ({os.path.getsize(png_path)} bytes)")
+            characters.append((hanzi_char, svg_path, num_strokes))
+    
+    # Check which characters still need their PNGs
+    png_sizes = scan_pngs(pngs_dir)
+    to_build = []
+    for hanzi_char, svg_path, num_strokes in characters:
+        all_pngs_exist = all(png_sizes.get(f"{hanzi_char}_step_{i:02d}.png", 0) > 0
+                             for i in range(1, num_strokes + 1))
+        if all_pngs_exist:
+            print(f"⏩ All PNGs for {hanzi_char} already exist, skipping generation")
+        else:
+            to_build.append((hanzi_char, svg_path))
+    
+    # Generate stroke steps; every character is independent, so build them in parallel
+    if to_build:
+        # Each worker already handles a whole character, so it renders its steps
+        # serially instead of starting a step pool of its own
+        build_char = functools.partial(generate_stroke_step_pngs, max_workers=1)
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(build_char,
+                              [svg_path for _, svg_path in to_build],
+                              [hanzi_char for hanzi_char, _ in to_build]))
+        png_sizes = scan_pngs(pngs_dir)
+    
+    for hanzi_char, svg_path, num_strokes in characters:
+        # Verify each step
+        step = 1
+        while True:
+            png_name = f"{hanzi_char}_step_{step:02d}.png"
+            if png_name not in png_sizes:
+                break
                 
-                step += 1
-            
-            total_steps = step - 1
-            print(f"\nSummary for {hanzi_char}:")
-            print(f"- Total strokes in SVG: {num_strokes}")
-            print(f"- Total PNG steps generated: {total_steps}")
-            if num_strokes != total_steps:
-                print(f"❌ Warning: Number of strokes ({num_strokes}) doesn't match number of steps ({total_steps})")
+            # Check if the PNG exists and is valid
+            if png_sizes[png_name] == 0:
+                print(f"❌ Step {step}: Empty PNG file")
             else:
-                print("✅ Number of strokes matches number of steps")
+                print(f"✅ Step {step}: PNG exists ({png_sizes[png_name]} bytes)")
+            
+            step += 1
+        
+        total_steps = step - 1
+        print(f"\nSummary for {hanzi_char}:")
+        print(f"- Total strokes in SVG: {num_strokes}")
+        print(f"- Total PNG steps generated: {total_steps}")
+        if num_strokes != total_steps:
+            print(f"❌ Warning: Number of strokes ({num_strokes}) doesn't match number of steps ({total_steps})")
+        else:
+            print("✅ Number of strokes matches number of steps")
 
 if __name__ == "__main__":
     test_stroke_generation() 
\ No newline at end of file
@@ -4,18 +4,22 @@ Utils package for Chinese books project.
 
 from .get_hanzi_stroke_svgs import get_hanzi_stroke_svgs
 from .process_svg import process_svg
+from .render_svg_to_png import render_svg_to_png, render_svgs_to_png
 from .generate_stroke_step_pngs import generate_stroke_step_pngs
 from .generate_latex_stroke_sequence import generate_latex_stroke_sequence
-from .write_latex_to_pdf import write_latex_to_pdf
+from .write_latex_to_pdf import write_latex_to_pdf, write_latex_to_pdfs
 from .generate_latex_header import generate_latex_header
 from .get_translation import lookup
 
 __all__ = [
     'get_hanzi_stroke_svgs',
     'process_svg',
+    'render_svg_to_png',
+    'render_svgs_to_png',
     'generate_stroke_step_pngs',
     'generate_latex_stroke_sequence',
     'write_latex_to_pdf',
+    'write_latex_to_pdfs',
     'generate_latex_header',
     'lookup'
 ]
@@ -1,6 +1,11 @@
-import json
 import os
-from wordfreq import word_frequency
+import sys
+
+# Add parent directory to path so we can import utils when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.get_frequency_score import get_frequency_score
+from utils.json_io import load_json, dump_json
 
 def add_frequency_scores(words):
     """
@@ -12,16 +17,20 @@ def add_frequency_scores(words):
     Returns:
         List of word dictionaries with added frequency scores
     """
-    total = len(words)
     print("Adding frequency scores...")
-    for i, word in enumerate(words, 1):
-        if i % 100 == 0:  # Print progress every 100 words
-            print(f"\rProcessing word {i}/{total}", end='')
-            
-        chinese_word = word['chineseword']
-        # Get frequency score using wordfreq
-        # Use 'zh' for Mandarin Chinese with best wordlist
-        word['frequency_score'] = word_frequency(chinese_word, 'zh', wordlist='best')
+    # The same headword shows up at several levels, so look up each distinct
+    # word once (dict.fromkeys keeps the first-seen order)
+    unique_words = list(dict.fromkeys(word['chineseword'] for word in words))
+    total = len(unique_words)
+    scores = {}
+    # Work in batches of 100 words and print progress after each batch
+    for start in range(0, total, 100):
+        for chinese_word in unique_words[start:start + 100]:
+            scores[chinese_word] = get_frequency_score(chinese_word)
+        print(f"\rProcessing word {min(start + 100, total)}/{total}", end='')
+
+    for word in words:
+        word['frequency_score'] = scores[word['chineseword']]
     
     print("\nFrequency score update completed!")
     return words
@@ -36,16 +45,14 @@ if __name__ == "__main__":
     
     # Read existing words
     print(f"Reading words from {input_path}")
-    with open(input_path, "r", encoding="utf-8") as f:
-        words = json.load(f)
+    words = load_json(input_path)
     
     # Add frequency scores
     words_with_frequency = add_frequency_scores(words)
     
     # Save updated words
     print(f"\nSaving words with frequency scores to {output_path}")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(words_with_frequency, f, ensure_ascii=False, indent=2)
+    dump_json(words_with_frequency, output_path)
     
     print("\nDone! Sample of first 5 words with frequency scores:")
     for word in words_with_frequency[:5]:
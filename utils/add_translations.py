@@ -1,7 +1,18 @@
-import json
 import os
+import pickle
+import sys
+from collections import defaultdict
+import pycccedict.cccedict
 from pycccedict.cccedict import CcCedict
 
+# Add parent directory to path so we can import utils when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_io import load_json, dump_json
+
+# Pickled translation map, so later runs skip parsing CC-CEDICT
+CEDICT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cedict_map.pkl")
+
 def create_translation_map():
     """
     Create a map of Chinese words to their translations from CC-CEDICT.
@@ -9,27 +20,60 @@ def create_translation_map():
     Returns:
         dict: A dictionary mapping Chinese words to their translations
     """
+    # Reuse the pickled map unless pycccedict was installed or upgraded after it was written
+    try:
+        if os.stat(CEDICT_CACHE_PATH).st_mtime_ns >= os.stat(pycccedict.cccedict.__file__).st_mtime_ns:
+            with open(CEDICT_CACHE_PATH, 'rb') as f:
+                translation_map = pickle.load(f)
+            print(f"Dictionary loaded from cache with {len(translation_map)} entries")
+            return translation_map
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass  # Missing or unreadable cache, parse CC-CEDICT instead
+    
     print("Loading CC-CEDICT dictionary...")
     cedict = CcCedict()
     entries = cedict.get_entries()
     
     # Create a map for both traditional and simplified characters
-    translation_map = {}
+    translation_map = defaultdict(list)
     for entry in entries:
+        simplified = entry['simplified']
+        traditional = entry['traditional']
+        definitions = entry['definitions']
         # Add simplified character mapping
-        if entry['simplified'] not in translation_map:
-            translation_map[entry['simplified']] = []
-        translation_map[entry['simplified']].extend(entry['definitions'])
+        translation_map[simplified].extend(definitions)
         
         # Add traditional character mapping if different
-        if entry['traditional'] != entry['simplified']:
-            if entry['traditional'] not in translation_map:
-                translation_map[entry['traditional']] = []
-            translation_map[entry['traditional']].extend(entry['definitions'])
+        if traditional != simplified:
+            translation_map[traditional].extend(definitions)
+    
+    # Hand back a plain dict so missing words don't get inserted on lookup
+    translation_map = dict(translation_map)
+    try:
+        # Write to a temporary file first so an interrupted run never leaves a truncated cache
+        tmp_path = CEDICT_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(translation_map, f, protocol=5)
+        os.replace(tmp_path, CEDICT_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: Could not write cache {CEDICT_CACHE_PATH}: {e}")
     
     print(f"Dictionary loaded with {len(translation_map)} entries")
     return translation_map
 
+def get_word_translations(translation_map, chinese_word):
+    """
+    Look up the translations of a single word.
+    
+    Args:
+        translation_map: Map returned by create_translation_map
+        chinese_word: The word to look up
+        
+    Returns:
+        list: The word's CC-CEDICT definitions, or an empty list if it has none
+    """
+    return translation_map.get(chinese_word, [])
+
 def add_translations(words):
     """
     Add translations to each word in the list using a pre-loaded translation map.
@@ -43,16 +87,11 @@ def add_translations(words):
     # Create translation map once
     translation_map = create_translation_map()
     
-    total = len(words)
-    print("Adding translations...")
-    for i, word in enumerate(words, 1):
-        if i % 100 == 0:  # Print progress every 100 words
-            print(f"\rProcessing word {i}/{total}", end='')
-            
-        chinese_word = word['chineseword']
-        word['translations'] = translation_map.get(chinese_word, [])
+    print(f"Adding translations to {len(words)} words...")
+    for word in words:
+        word['translations'] = get_word_translations(translation_map, word['chineseword'])
     
-    print("\nTranslation completed!")
+    print("Translation completed!")
     return words
 
 if __name__ == "__main__":
@@ -65,16 +104,14 @@ if __name__ == "__main__":
     
     # Read existing words
     print(f"Reading words from {input_path}")
-    with open(input_path, "r", encoding="utf-8") as f:
-        words = json.load(f)
+    words = load_json(input_path)
     
     # Add translations
     words_with_translations = add_translations(words)
     
     # Save updated words
     print(f"\nSaving words with translations to {output_path}")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(words_with_translations, f, ensure_ascii=False, indent=2)
+    dump_json(words_with_translations, output_path)
     
     print("\nDone! Sample of first 5 words with translations:")
     for word in words_with_translations[:5]:
@@ -0,0 +1,63 @@
+import os
+import sys
+
+# Add parent directory to path so we can import utils when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.add_translations import create_translation_map, get_word_translations
+from utils.get_frequency_score import get_frequency_score
+from utils.json_io import load_json, dump_json
+
+def enrich_words(words):
+    """
+    Add translations and frequency scores to each word in a single pass.
+
+    Does the work of add_translations followed by add_frequency_scores
+    without writing and re-reading the intermediate translations file.
+
+    Args:
+        words: List of word dictionaries
+
+    Returns:
+        List of word dictionaries with added translations and frequency scores
+    """
+    # Create translation map once
+    translation_map = create_translation_map()
+
+    print(f"Adding translations and frequency scores to {len(words)} words...")
+    # Same lookups as add_translations and add_frequency_scores; get_frequency_score
+    # is memoized, so a headword that shows up at several levels is scored once
+    for word in words:
+        chinese_word = word['chineseword']
+        word['translations'] = get_word_translations(translation_map, chinese_word)
+        word['frequency_score'] = get_frequency_score(chinese_word)
+
+    print("Enrichment completed!")
+    return words
+
+if __name__ == "__main__":
+    # Get the directory of the current script
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Input and output file paths
+    input_path = os.path.join(current_dir, "..", "chinese_words_all.json")
+    output_path = os.path.join(current_dir, "..", "chinese_words_with_frequency.json")
+
+    # Read existing words
+    print(f"Reading words from {input_path}")
+    words = load_json(input_path)
+
+    # Add translations and frequency scores
+    enriched_words = enrich_words(words)
+
+    # Save updated words
+    print(f"\nSaving enriched words to {output_path}")
+    dump_json(enriched_words, output_path)
+
+    print("\nDone! Sample of first 5 enriched words:")
+    for word in enriched_words[:5]:
+        print(f"\n{word['chineseword']} ({word['pinyin']}):")
+        print(f"Frequency score: {word['frequency_score']:.6f}")
+        print(f"Translations: {', '.join(word['translations'])}")
+        print(f"Grammar: {word['grammar']}")
+        print(f"Level: {word['lowest_level']}")
@@ -1,8 +1,19 @@
 import pandas as pd
 import os
+import re
 from typing import List, Dict
 from collections import Counter
 
+# Matches any character from the CJK Unified Ideographs block
+HAS_CJK = re.compile('[\u4e00-\u9fff]').search
+
+def _cell_text(value) -> str:
+    """Return a spreadsheet cell as stripped text, or '' for an empty cell."""
+    # Empty cells come back as NaN, the only value that isn't equal to itself
+    if value is None or value != value:
+        return ''
+    return str(value).strip()
+
 def extract_chinese_words(excel_path: str, sheet_names: list[str]) -> List[Dict[str, str]]:
     """
     Extract Chinese words from multiple sheets in the TOCFL Excel file.
@@ -44,21 +55,23 @@ def extract_chinese_words(excel_path: str, sheet_names: list[str]) -> List[Dict[
             # Read the Excel file with specified sheet
             df = pd.read_excel(excel_path, sheet_name=sheet_name)
             
-            # Get the words starting from row 3
-            for _, row in df.iloc[2:].iterrows():
-                if pd.isna(row['詞彙']):  # Skip empty rows
+            # Get the words starting from row 3, one plain array per column
+            rows = df.iloc[2:]
+            for raw_word, raw_pinyin, raw_grammar in zip(rows['詞彙'].to_numpy(),
+                                                         rows['拼音'].to_numpy(),
+                                                         rows['詞類'].to_numpy()):
+                word = _cell_text(raw_word)
+                if not word:  # Skip empty rows
                     continue
-                    
-                word = str(row['詞彙']).strip()
                 
                 # Only process if it contains Chinese characters
-                if any('\u4e00' <= char <= '\u9fff' for char in word):
+                if HAS_CJK(word):
                     if word not in word_dict:
                         # Initialize new word entry
                         word_dict[word] = {
                             'chineseword': word,
-                            'pinyin': str(row['拼音']).strip() if not pd.isna(row['拼音']) else '',
-                            'grammar': str(row['詞類']).strip() if not pd.isna(row['詞類']) else '',
+                            'pinyin': _cell_text(raw_pinyin),
+                            'grammar': _cell_text(raw_grammar),
                             'levels': [],
                             'lowest_level': current_level
                         }
@@ -71,8 +84,8 @@ def extract_chinese_words(excel_path: str, sheet_names: list[str]) -> List[Dict[
                     if level_ranking.index(current_level) < level_ranking.index(word_dict[word]['lowest_level']):
                         word_dict[word]['lowest_level'] = current_level
                         # Update pinyin and grammar from the lowest level occurrence
-                        word_dict[word]['pinyin'] = str(row['拼音']).strip() if not pd.isna(row['拼音']) else ''
-                        word_dict[word]['grammar'] = str(row['詞類']).strip() if not pd.isna(row['詞類']) else ''
+                        word_dict[word]['pinyin'] = _cell_text(raw_pinyin)
+                        word_dict[word]['grammar'] = _cell_text(raw_grammar)
         
         # Convert dictionary to list
         unique_words = list(word_dict.values())
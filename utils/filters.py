@@ -1,5 +1,11 @@
 from typing import List, Dict, Optional, Callable, Tuple
+import functools
+import re
 import unicodedata
+from operator import itemgetter
+
+# Levels from lowest to highest
+LEVEL_ORDER = {'foundation': 0, 'beginner': 1, 'intermediate': 2, 'advanced': 3}
 
 def filter_by_level(words: List[Dict], level: str) -> List[Dict]:
     """
@@ -12,7 +18,7 @@ def filter_by_level(words: List[Dict], level: str) -> List[Dict]:
     Returns:
         Filtered list of words
     """
-    return [word for word in words if word.get('lowest_level', '') == level]
+    return filter_by_custom(words, has_lowest_level(level))
 
 def filter_by_grammar(words: List[Dict], grammar: str) -> List[Dict]:
     """
@@ -25,14 +31,7 @@ def filter_by_grammar(words: List[Dict], grammar: str) -> List[Dict]:
     Returns:
         Filtered list of words
     """
-    # Handle both formats: with and without parentheses
-    grammar = grammar.upper()
-    return [word for word in words 
-            if word.get('grammar', '').upper() == grammar 
-            or word.get('grammar', '').upper() == f'({grammar})'
-            or word.get('grammar', '').upper().startswith(f'{grammar}/')
-            or word.get('grammar', '').upper().startswith(f'({grammar})/')
-    ]
+    return filter_by_custom(words, has_grammar(grammar))
 
 def filter_by_multiple_levels(words: List[Dict], min_levels: int = 2) -> List[Dict]:
     """
@@ -45,7 +44,7 @@ def filter_by_multiple_levels(words: List[Dict], min_levels: int = 2) -> List[Di
     Returns:
         Filtered list of words
     """
-    return [word for word in words if len(word.get('levels', [])) >= min_levels]
+    return filter_by_custom(words, appears_in_min_levels(min_levels))
 
 def filter_by_custom(words: List[Dict], predicate: Callable[[Dict], bool]) -> List[Dict]:
     """
@@ -60,27 +59,43 @@ def filter_by_custom(words: List[Dict], predicate: Callable[[Dict], bool]) -> Li
     """
     return [word for word in words if predicate(word)]
 
-def apply_filters(words: List[Dict], filters: List[Callable[[List[Dict]], List[Dict]]]) -> List[Dict]:
+def apply_filters(words: List[Dict], predicates: List[Callable[[Dict], bool]]) -> List[Dict]:
     """
-    Apply multiple filters in sequence.
+    Apply multiple filters in a single pass over the words.
+    
+    Every word is checked against all predicates in turn and dropped at the
+    first one that fails, so no intermediate list is built per filter. List
+    based filters such as filter_by_level can be passed through as_predicate.
     
     Args:
         words: List of word dictionaries
-        filters: List of filter functions to apply
+        predicates: Predicates that each take a word dictionary and return True/False
         
     Returns:
         Filtered list of words
     """
-    result = words
-    for filter_func in filters:
-        result = filter_func(result)
-    return result
+    if not predicates:
+        return words
+    matches = combine_predicates(predicates)
+    return [word for word in words if matches(word)]
+
+def as_predicate(filter_func: Callable[[List[Dict]], List[Dict]]) -> Callable[[Dict], bool]:
+    """Wrap a list based filter function so it can be used as a per-word predicate."""
+    def predicate(word: Dict) -> bool:
+        return bool(filter_func([word]))
+    return predicate
 
 # Example predicates for custom filtering
 def has_translation_containing(text: str) -> Callable[[Dict], bool]:
     """Create a predicate to filter words by translation content."""
+    text = text.lower()
+    if not text:
+        # An empty query matches every word that has at least one translation
+        def predicate(word: Dict) -> bool:
+            return bool(word.get('translations'))
+        return predicate
     def predicate(word: Dict) -> bool:
-        return any(text.lower() in trans.lower() for trans in word.get('translations', []))
+        return text in _translation_blob(word)
     return predicate
 
 def appears_in_level(level: str) -> Callable[[Dict], bool]:
@@ -89,10 +104,97 @@ def appears_in_level(level: str) -> Callable[[Dict], bool]:
         return level in word.get('levels', [])
     return predicate
 
+def has_lowest_level(level: str) -> Callable[[Dict], bool]:
+    """Create a predicate to filter words by their lowest level."""
+    def predicate(word: Dict) -> bool:
+        return word.get('lowest_level', '') == level
+    return predicate
+
+def has_grammar(grammar: str) -> Callable[[Dict], bool]:
+    """Create a predicate to filter words by their grammar category."""
+    # Handle both formats: with and without parentheses, optionally followed by /other categories
+    grammar = re.escape(grammar.upper())
+    match = re.compile(rf'(?:{grammar}|\({grammar}\))(?:/.*)?', re.DOTALL).fullmatch
+    def predicate(word: Dict) -> bool:
+        # The uppercased grammar is stored on the word, so later grammar filters skip upper()
+        word_grammar = word.get('_grammar_upper')
+        if word_grammar is None:
+            word_grammar = word.get('grammar', '').upper()
+            word['_grammar_upper'] = word_grammar
+        return match(word_grammar) is not None
+    return predicate
+
+def appears_in_min_levels(min_levels: int) -> Callable[[Dict], bool]:
+    """Create a predicate to filter words that appear in at least min_levels levels."""
+    def predicate(word: Dict) -> bool:
+        return len(word.get('levels', [])) >= min_levels
+    return predicate
+
+def combine_predicates(predicates: List[Callable[[Dict], bool]]) -> Callable[[Dict], bool]:
+    """
+    Combine several predicates into a single predicate that requires all of them to match.
+    
+    Lets a word list be filtered in one pass instead of one pass per filter.
+    
+    Args:
+        predicates: Predicates that each take a word dictionary and return True/False
+        
+    Returns:
+        Predicate that is True when every given predicate is True
+    """
+    predicates = list(predicates)
+    if len(predicates) == 1:
+        return predicates[0]
+    
+    def predicate(word: Dict) -> bool:
+        for pred in predicates:
+            if not pred(word):
+                return False
+        return True
+    return predicate
+
+def _build_tone_table() -> Dict[int, Optional[str]]:
+    """Build a str.translate table that strips tone marks and other accents from Latin letters."""
+    table = {}
+    # Latin-1 Supplement, Latin Extended-A/B and Latin Extended Additional hold every toned vowel
+    for start, end in ((0x00C0, 0x024F), (0x1E00, 0x1EFF)):
+        for codepoint in range(start, end + 1):
+            char = chr(codepoint)
+            base = ''.join(c for c in unicodedata.normalize('NFD', char)
+                           if unicodedata.category(c) != 'Mn')
+            if base != char:
+                table[codepoint] = base
+    # Combining marks left over in already decomposed input are dropped
+    for codepoint in range(0x0300, 0x0370):
+        table[codepoint] = None
+    return table
+
+_TONE_TABLE = _build_tone_table()
+
+@functools.lru_cache(maxsize=65536)
 def normalize_pinyin(text: str) -> str:
     """Remove tone marks from pinyin."""
-    return ''.join(char for char in unicodedata.normalize('NFD', text)
-                  if unicodedata.category(char) != 'Mn')
+    return text.translate(_TONE_TABLE)
+
+def _prepare_text_query(field: str, query: str, normalize: bool) -> Tuple[str, str, bool]:
+    """Return the word key holding the prepared field text, the prepared query and the normalize flag."""
+    normalize = normalize and field == 'pinyin'
+    query = query.lower()
+    if normalize:
+        query = normalize_pinyin(query)
+    # The prepared field text is stored on each word, so later searches skip lower() and normalization
+    key = f'_{field}_normalized' if normalize else f'_{field}_lower'
+    return key, query, normalize
+
+def _prepared_text(word: Dict, field: str, key: str, normalize: bool) -> str:
+    """Return the word's prepared field text, computing it on first use."""
+    field_value = word.get(key)
+    if field_value is None:
+        field_value = word.get(field, '').lower()
+        if normalize:
+            field_value = normalize_pinyin(field_value)
+        word[key] = field_value
+    return field_value
 
 def filter_by_text(words: List[Dict], field: str, query: str, normalize: bool = False) -> List[Dict]:
     """
@@ -107,17 +209,85 @@ def filter_by_text(words: List[Dict], field: str, query: str, normalize: bool =
     Returns:
         Filtered list of words
     """
-    query = query.lower()
-    if normalize and field == 'pinyin':
-        query = normalize_pinyin(query)
+    key, query, normalize = _prepare_text_query(field, query, normalize)
     
-    def matches(word: Dict) -> bool:
-        field_value = word.get(field, '').lower()
-        if normalize and field == 'pinyin':
-            field_value = normalize_pinyin(field_value)
-        return query in field_value
+    for word in words:
+        if key not in word:
+            _prepared_text(word, field, key, normalize)
+    
+    # Every word is prepared now, so the match itself is an inline substring test
+    return [word for word in words if query in word[key]]
+
+def contains_text(field: str, query: str, normalize: bool = False) -> Callable[[Dict], bool]:
+    """Create a predicate to filter words by text content in a specific field, like filter_by_text."""
+    key, query, normalize = _prepare_text_query(field, query, normalize)
+    def predicate(word: Dict) -> bool:
+        return query in _prepared_text(word, field, key, normalize)
+    return predicate
+
+def _lowered_translations(word: Dict) -> List[str]:
+    """Return the word's lowercased translations, computing them on first use."""
+    trans_lower = word.get('_trans_lower')
+    if trans_lower is None:
+        trans_lower = [trans.lower() for trans in word.get('translations', [])]
+        word['_trans_lower'] = trans_lower
+    return trans_lower
+
+def _translation_blob(word: Dict) -> str:
+    """Return the word's lowercased translations joined by newlines, computing them on first use."""
+    # One substring test over the joined text replaces a test per translation;
+    # the newline separator keeps a query from matching across two translations
+    trans_blob = word.get('_trans_blob')
+    if trans_blob is None:
+        trans_blob = '\n'.join(_lowered_translations(word))
+        word['_trans_blob'] = trans_blob
+    return trans_blob
+
+def _translation_tokens(word: Dict) -> List[set]:
+    """Return the set of complete words in each translation, computing them on first use."""
+    trans_tokens = word.get('_trans_tokens')
+    if trans_tokens is None:
+        trans_tokens = [set(token.strip('.,;()[]') for token in trans.split())
+                        for trans in _lowered_translations(word)]
+        word['_trans_tokens'] = trans_tokens
+    return trans_tokens
+
+def prepare_filter_index(words: List[Dict]) -> List[Dict]:
+    """
+    Precompute the lowercased translations, their joined text and their complete words on each word.
+    
+    filter_by_translation fills these in on demand as well; calling this up front
+    just moves the work out of the first search. The added keys start with an
+    underscore and should be dropped before the words are written back to JSON.
     
-    return filter_by_custom(words, matches)
+    Args:
+        words: List of word dictionaries
+        
+    Returns:
+        The same list of words, annotated in place
+    """
+    for word in words:
+        _translation_blob(word)
+        _translation_tokens(word)
+    return words
+
+def prepare_pinyin_index(words: List[Dict]) -> List[Dict]:
+    """
+    Precompute the normalized pinyin searched by filter_by_text(..., normalize=True).
+    
+    Like prepare_filter_index, this only moves work that would otherwise be done
+    on the first pinyin search. The added key starts with an underscore.
+    
+    Args:
+        words: List of word dictionaries
+        
+    Returns:
+        The same list of words, annotated in place
+    """
+    key, _, normalize = _prepare_text_query('pinyin', '', True)
+    for word in words:
+        _prepared_text(word, 'pinyin', key, normalize)
+    return words
 
 def filter_by_translation(words: List[Dict], query: str, exact: bool = False) -> List[Dict]:
     """
@@ -133,18 +303,25 @@ def filter_by_translation(words: List[Dict], query: str, exact: bool = False) ->
     """
     query = query.lower()
     
-    def matches_translation(translation: str) -> bool:
-        translation = translation.lower()
-        if exact:
-            # Split translation into words and check if query matches any complete word
-            trans_words = set(word.strip('.,;()[]') for word in translation.split())
-            return query in trans_words
-        else:
-            # Check if query appears anywhere in the translation
-            return query in translation
+    if exact:
+        # Check if query matches any complete word of a translation
+        return [word for word in words
+                if any(query in tokens for tokens in _translation_tokens(word))]
     
-    return [word for word in words 
-            if any(matches_translation(trans) for trans in word.get('translations', []))]
+    # Check if query appears anywhere in the translation
+    # An empty query matches every word that has at least one translation
+    if not query:
+        return [word for word in words if word.get('translations')]
+    return [word for word in words if query in _translation_blob(word)]
+
+def has_translation_matching(query: str, exact: bool = False) -> Callable[[Dict], bool]:
+    """Create a predicate to filter words by their translations, like filter_by_translation."""
+    if not exact:
+        return has_translation_containing(query)
+    query = query.lower()
+    def predicate(word: Dict) -> bool:
+        return any(query in tokens for tokens in _translation_tokens(word))
+    return predicate
 
 def sort_by_pinyin(words: List[Dict], reverse: bool = False) -> List[Dict]:
     """
@@ -157,7 +334,7 @@ def sort_by_pinyin(words: List[Dict], reverse: bool = False) -> List[Dict]:
     Returns:
         Sorted list of words
     """
-    return sorted(words, key=lambda x: x['pinyin'], reverse=reverse)
+    return sorted(words, key=itemgetter('pinyin'), reverse=reverse)
 
 def sort_by_stroke_count(words: List[Dict], reverse: bool = False) -> List[Dict]:
     """
@@ -172,6 +349,18 @@ def sort_by_stroke_count(words: List[Dict], reverse: bool = False) -> List[Dict]
     """
     return sorted(words, key=lambda x: sum(x.get('stroke_numbers', (0,))), reverse=reverse)
 
+def _frequency_key(freq) -> float:
+    """Turn a frequency score into a sortable number; missing or invalid scores count as 0."""
+    if freq is None:
+        return 0.0
+    # Convert to float if it's a string
+    if isinstance(freq, str):
+        try:
+            return float(freq)
+        except ValueError:
+            return 0.0
+    return float(freq)
+
 def sort_by_frequency(words: List[Dict], reverse: bool = False) -> List[Dict]:
     """
     Sort words by frequency score.
@@ -184,28 +373,22 @@ def sort_by_frequency(words: List[Dict], reverse: bool = False) -> List[Dict]:
     Returns:
         Sorted list of words
     """
-    # Check if any word has frequency data
-    words_with_frequency = [word for word in words if 'frequency_score' in word and word['frequency_score'] is not None]
+    # Coerce every frequency to a number once, noting whether any word has one
+    keys = []
+    has_frequency = False
+    for word in words:
+        freq = word.get('frequency_score')
+        if freq is not None:
+            has_frequency = True
+        keys.append(_frequency_key(freq))
     
-    if not words_with_frequency:
+    if not has_frequency:
         print("Warning: No frequency data found in the words. All frequency_score values are missing or None.")
         print("Falling back to pinyin sorting.")
         return sort_by_pinyin(words, reverse)
     
-    # Ensure frequency values are treated as numbers
-    def get_frequency(word: Dict) -> float:
-        freq = word.get('frequency_score')
-        if freq is None:
-            return 0.0
-        # Convert to float if it's a string
-        if isinstance(freq, str):
-            try:
-                return float(freq)
-            except ValueError:
-                return 0.0
-        return float(freq)
-    
-    return sorted(words, key=get_frequency, reverse=reverse)
+    order = sorted(range(len(words)), key=keys.__getitem__, reverse=reverse)
+    return [words[i] for i in order]
 
 def sort_by_level(words: List[Dict], reverse: bool = False) -> List[Dict]:
     """
@@ -219,8 +402,8 @@ def sort_by_level(words: List[Dict], reverse: bool = False) -> List[Dict]:
     Returns:
         Sorted list of words
     """
-    level_order = {'foundation': 0, 'beginner': 1, 'intermediate': 2, 'advanced': 3}
-    return sorted(words, key=lambda x: level_order.get(x.get('lowest_level', ''), -1), reverse=reverse)
+    rank = LEVEL_ORDER.get
+    return sorted(words, key=lambda x: rank(x.get('lowest_level', ''), -1), reverse=reverse)
 
 def apply_sort(words: List[Dict], sort_func: Callable[[List[Dict], bool], List[Dict]], reverse: bool = False) -> List[Dict]:
     """
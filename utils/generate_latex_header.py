@@ -1,3 +1,23 @@
+# LaTeX braces are doubled so the template can be filled in with str.format
+_HEADER_TEMPLATE = (
+    "\\noindent\n"
+    "\\begin{{minipage}}[t]{{0.25\\linewidth}}\n"
+    "\\raggedright\n"  # Left align
+    "{{\\Large {pinyin}}}\n"
+    "\\end{{minipage}}\n"
+    "\\hfill\n"
+    "\\begin{{minipage}}[t]{{0.35\\linewidth}}\n"
+    "\\centering\n"
+    "{{\\fontsize{{32pt}}{{36pt}}\\selectfont {characters}}}\n"
+    "\\end{{minipage}}\n"
+    "\\hfill\n"
+    "\\begin{{minipage}}[t]{{0.35\\linewidth}}\n"
+    "\\raggedright\n"  # Left align
+    "{{\\large\\parbox[t]{{\\linewidth}}{{{translations}}}}}\n"
+    "\\end{{minipage}}\n"
+    "\\vspace{{1em}}\n"
+)
+
 def generate_latex_header(pinyin: str, characters: str, translation: str) -> str:
     """
     Generate LaTeX code for a header section with pinyin, Chinese characters, and translation.
@@ -17,21 +37,4 @@ def generate_latex_header(pinyin: str, characters: str, translation: str) -> str
     else:
         formatted_trans = translation
 
-    return (
-        "\\noindent\n"
-        "\\begin{minipage}[t]{0.25\\linewidth}\n"
-        "\\raggedright\n"  # Left align
-        "{\\Large " + pinyin + "}\n"
-        "\\end{minipage}\n"
-        "\\hfill\n"
-        "\\begin{minipage}[t]{0.35\\linewidth}\n"
-        "\\centering\n"
-        "{\\fontsize{32pt}{36pt}\\selectfont " + characters + "}\n"
-        "\\end{minipage}\n"
-        "\\hfill\n"
-        "\\begin{minipage}[t]{0.35\\linewidth}\n"
-        "\\raggedright\n"  # Left align
-        "{\\large\\parbox[t]{\\linewidth}{" + formatted_trans + "}}\n"
-        "\\end{minipage}\n"
-        "\\vspace{1em}\n"
-    ) 
\ No newline at end of file
+    return _HEADER_TEMPLATE.format(pinyin=pinyin, characters=characters, translations=formatted_trans)
@@ -1,17 +1,44 @@
 import os
+from typing import Optional
 
-def generate_latex_stroke_sequence(char_label: str) -> str:
-    """Generate LaTeX code for including a sequence of stroke images."""
-    output_dir = "output/pngs"  # Keep the same output directory as original
+OUTPUT_DIR = "output/pngs"  # Keep the same output directory as original
+
+# Names of the rendered PNGs and the directory modification time they were read at
+_png_names = set()
+_png_dir_mtime = None
+
+def _rendered_pngs() -> set:
+    """Return the names of the files in the PNG directory, scanning it again only after it changed."""
+    global _png_names, _png_dir_mtime
+    try:
+        mtime = os.stat(OUTPUT_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return set()
+    if mtime != _png_dir_mtime:
+        with os.scandir(OUTPUT_DIR) as entries:
+            _png_names = {entry.name for entry in entries}
+        _png_dir_mtime = mtime
+    return _png_names
+
+def generate_latex_stroke_sequence(char_label: str, total_strokes: Optional[int] = None) -> str:
+    """
+    Generate LaTeX code for including a sequence of stroke images.
+    
+    Args:
+        char_label: The character whose step PNGs to include
+        total_strokes: Number of stroke steps; when omitted it is counted from a
+            listing of the PNG directory that is only refreshed when the directory changes
+    """
     steps = []
     
     # Count total number of strokes
-    total_strokes = 0
-    for i in range(1, 30):
-        png_path = os.path.join(output_dir, f"{char_label}_step_{i:02d}.png")
-        if not os.path.exists(png_path):
-            break
-        total_strokes += 1
+    if total_strokes is None:
+        png_names = _rendered_pngs()
+        total_strokes = 0
+        for i in range(1, 30):
+            if f"{char_label}_step_{i:02d}.png" not in png_names:
+                break
+            total_strokes += 1
     
     # Calculate number of lines needed (8 strokes per line)
     strokes_per_line = 8
@@ -26,8 +53,10 @@ def generate_latex_stroke_sequence(char_label: str) -> str:
         start_stroke = line * strokes_per_line + 1
         end_stroke = min((line + 1) * strokes_per_line, total_strokes)
         
-        for i in range(start_stroke, end_stroke + 1):
-            steps.append(rf"\node[draw,on chain,inner sep=0pt,outer sep=0pt,join] {{\includegraphics[width=0.12\linewidth]{{{char_label}_step_{i:02d}.png}}}};")
+        steps.append("\n".join(
+            rf"\node[draw,on chain,inner sep=0pt,outer sep=0pt,join] {{\includegraphics[width=0.12\linewidth]{{{char_label}_step_{i:02d}.png}}}};"
+            for i in range(start_stroke, end_stroke + 1)
+        ))
         
         # End tikzpicture and add spacing
         steps.append(r"\end{tikzpicture}")
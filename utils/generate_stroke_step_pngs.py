@@ -1,18 +1,136 @@
+import atexit
+import json
 import os
-import subprocess
-from bs4 import BeautifulSoup
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+from lxml import etree
 from .process_svg import process_svg
+from .render_svg_to_png import render_svgs_to_png
 
-def generate_stroke_step_pngs(svg_path: str, output_prefix: str):
-    """Generate PNG files for each stroke step of a character."""
-    soup = process_svg(svg_path)
+OUTPUT_DIR = "output/pngs"  # Keep the same output directory as original
+
+# Comments put around each black stroke path to find it in the serialized SVG
+_STROKE_MARKER = re.compile(r"<!--stroke:(\d+)-->(.*?)<!--/stroke-->", re.DOTALL)
+
+# Worker pool shared by all characters, so each worker keeps its Inkscape shell between characters
+_step_executor = None
+_step_executor_workers = None
+
+def _get_step_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared step rendering pool, (re)starting it with the requested size."""
+    global _step_executor, _step_executor_workers
+    if _step_executor is None or _step_executor_workers != max_workers:
+        if _step_executor is not None:
+            _step_executor.shutdown()
+        _step_executor = ProcessPoolExecutor(max_workers=max_workers)
+        _step_executor_workers = max_workers
+    return _step_executor
+
+def _shutdown_step_executor() -> None:
+    """Stop the shared step rendering pool, if one was started."""
+    global _step_executor
+    if _step_executor is not None:
+        _step_executor.shutdown()
+        _step_executor = None
+
+atexit.register(_shutdown_step_executor)
+
+def _read_meta(meta_path: str) -> dict:
+    """Read the sidecar describing the last complete render of a character."""
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _split_strokes(root: etree._Element) -> List[Union[str, Tuple[int, str]]]:
+    """
+    Serialize the processed SVG once, cut into fixed markup and black stroke paths.
+    
+    Returns a list whose items are either literal markup or (stroke number, path markup)
+    pairs, in document order.
+    """
+    for path in list(root.iter("{*}path")):
+        stroke_class = path.get('class', '')
+        if not stroke_class.startswith('stroke-'):
+            continue
+        try:
+            stroke_num = int(stroke_class.split('-')[1])
+        except (IndexError, ValueError):
+            continue
+        end_marker = etree.Comment("/stroke")
+        end_marker.tail = path.tail
+        path.tail = None
+        path.addprevious(etree.Comment(f"stroke:{stroke_num}"))
+        path.addnext(end_marker)
+    
+    # re.split returns the text between strokes with the stroke number and path markup after each
+    parts = _STROKE_MARKER.split(etree.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8"))
+    pieces = []
+    for k in range(0, len(parts), 3):
+        pieces.append(parts[k])
+        if k + 2 < len(parts):
+            pieces.append((int(parts[k + 1]), parts[k + 2]))
+    return pieces
+
+def _step_svg(pieces: List[Union[str, Tuple[int, str]]], step: int) -> str:
+    """Put together the SVG for a step: everything but the black strokes after it."""
+    return "".join(piece if isinstance(piece, str) else (piece[1] if piece[0] <= step else "")
+                   for piece in pieces)
+
+def _render_steps(task: tuple) -> None:
+    """Write the SVGs for the given steps of a character and render them in one Inkscape batch."""
+    pieces, steps, output_prefix = task
+    jobs = []
+    for i in steps:
+        svg_out = os.path.join(OUTPUT_DIR, f"{output_prefix}_step_{i:02d}.svg")
+        png_out = os.path.join(OUTPUT_DIR, f"{output_prefix}_step_{i:02d}.png")
+
+        with open(svg_out, "w", encoding="utf-8") as out_svg:
+            out_svg.write(_step_svg(pieces, i))
+        jobs.append((svg_out, png_out))
+
+    render_svgs_to_png(jobs, width=300)
+
+    for _, png_out in jobs:
+        print(f"✅ Created: {png_out}")
+
+def generate_stroke_step_pngs(svg_path: str, output_prefix: str, max_workers: Optional[int] = None):
+    """
+    Generate PNG files for each stroke step of a character.
+    
+    Steps are rendered in parallel in a worker pool that is shared between calls.
+    
+    Args:
+        svg_path: Path to the character's stroke SVG
+        output_prefix: Prefix of the step file names, normally the character itself
+        max_workers: Number of worker processes (default: number of CPUs); 1 renders
+            the steps in this process, e.g. when the caller already runs one character per process
+    
+    Returns:
+        The number of stroke steps of the character
+    """
+    # A sidecar records the stroke count and the SVG modification time of the last complete render.
+    # When it still matches the SVG, everything is up to date and the SVG does not need to be parsed.
+    meta_path = os.path.join(OUTPUT_DIR, f"{output_prefix}.meta")
+    svg_mtime = os.stat(svg_path).st_mtime_ns
+    meta = _read_meta(meta_path)
+    if meta.get("svg_mtime_ns") == svg_mtime:
+        last_png = os.path.join(OUTPUT_DIR, f"{output_prefix}_step_{meta['strokes']:02d}.png")
+        if os.path.exists(last_png):
+            return meta['strokes']
+    
+    # PNGs rendered from an older version of the SVG are stale and have to be rendered again
+    svg_changed = bool(meta) and meta.get("svg_mtime_ns") != svg_mtime
+    
+    root = etree.fromstring(process_svg(svg_path))
     
     # Find all unique stroke numbers
-    all_paths = soup.find_all("path")
     stroke_numbers = set()
-    for path in all_paths:
+    for path in root.iter("{*}path"):
         stroke_class = path.get('class', '')
-        if stroke_class and isinstance(stroke_class, str) and stroke_class.startswith('stroke-'):
+        if stroke_class.startswith('stroke-'):
             try:
                 stroke_num = int(stroke_class.split('-')[1])
                 stroke_numbers.add(stroke_num)
@@ -21,9 +139,8 @@ def generate_stroke_step_pngs(svg_path: str, output_prefix: str):
     
     if not stroke_numbers:
         print(f"Warning: No strokes found in {svg_path}")
-        return
+        return 0
     
-    output_dir = "output/pngs"  # Keep the same output directory as original
     max_stroke = max(stroke_numbers)
     
     # Check for missing stroke numbers
@@ -32,32 +149,31 @@ def generate_stroke_step_pngs(svg_path: str, output_prefix: str):
         print(f"Warning: Missing stroke numbers: {sorted(missing_strokes)}")
     
     # Generate each step: gray background + progressively more black strokes
+    # The SVG is serialized once; each step is put together from the pieces without reparsing
+    pieces = _split_strokes(root)
+    steps = []
     for i in range(1, max_stroke + 1):
-        png_out = os.path.join(output_dir, f"{output_prefix}_step_{i:02d}.png")
+        png_out = os.path.join(OUTPUT_DIR, f"{output_prefix}_step_{i:02d}.png")
         
         # Skip if PNG already exists
-        if os.path.exists(png_out) and os.path.getsize(png_out) > 0:
+        if not svg_changed and os.path.exists(png_out) and os.path.getsize(png_out) > 0:
             print(f"⏩ Skipping: {png_out} (already exists)")
             continue
-            
-        step_soup = BeautifulSoup(str(soup), "xml")
         
-        # Remove all paths for strokes after the current one
-        for j in range(i + 1, max_stroke + 1):
-            remove_paths = step_soup.find_all("path", class_=f"stroke-{j}")
-            for path in remove_paths:
-                path.decompose()
-
-        svg_out = os.path.join(output_dir, f"{output_prefix}_step_{i:02d}.svg")
-
-        with open(svg_out, "w", encoding="utf-8") as out_svg:
-            out_svg.write(str(step_soup))
-
-        subprocess.run([
-            "inkscape", svg_out,
-            "--export-type=png",
-            f"--export-filename={png_out}",
-            "--export-width=300"
-        ], check=True)
+        steps.append(i)
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(steps) <= 1:
+        if steps:
+            _render_steps((pieces, steps, output_prefix))
+    else:
+        # Deal the steps out round-robin so every worker sends one batch to its Inkscape shell
+        num_batches = min(max_workers, len(steps))
+        tasks = [(pieces, steps[k::num_batches], output_prefix) for k in range(num_batches)]
+        # Consume the results so that errors from the workers are raised here
+        list(_get_step_executor(max_workers).map(_render_steps, tasks))
 
-        print(f"✅ Created: {png_out}")
+    # Record the complete render so the next call can return without parsing the SVG
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"strokes": max_stroke, "svg_mtime_ns": svg_mtime}, f)
+    return max_stroke
@@ -1,28 +1,48 @@
+import functools
 from wordfreq import word_frequency
 
-# Your list of entries (pinyin, traditional, meaning)
-entries = [
-    ("lóng", "龍", "Drache"),
-    ("zhǎng", "長", "lang"),
-    ("zhōng", "中", "Mitte"),
-    ("guó", "國", "Land"),
-    ("rén", "人", "Person"),
-    ("yī", "一", "eins"),
-    ("yīng wǔ", "鸚鵡", "Papagei"),
-    ("shā fā", "沙發", "Sofa"),
-    ("xǐ wǎn chí", "洗碗池", "Spülbecken / Spüle"),
-    ("mǎ tǒng", "馬桶", "Toilette")
-]
-
-# Add frequency scores (using 'zh' for Mandarin Chinese with best wordlist)
-entries_with_freq = [
-    (pinyin, hanzi, meaning, word_frequency(hanzi, 'zh', wordlist='best'))
-    for pinyin, hanzi, meaning in entries
-]
-
-# Sort by frequency in descending order
-sorted_entries = sorted(entries_with_freq, key=lambda x: x[3], reverse=True)
-
-# Print results
-for pinyin, hanzi, meaning, freq in sorted_entries:
-    print(f"{hanzi} ({pinyin}): {meaning} — freq: {freq:.6f}")
\ No newline at end of file
+@functools.lru_cache(maxsize=None)
+def get_frequency_score(hanzi: str) -> float:
+    """
+    Get the frequency score of a Chinese word or character.
+
+    Scores are cached per word, so repeated words cost a single dict lookup.
+    The lookup still goes through word_frequency rather than the raw 'zh'
+    frequency table: the table is keyed by simplified tokens, and only
+    word_frequency maps traditional characters and splits longer words.
+
+    Args:
+        hanzi: The word or character to score
+
+    Returns:
+        The frequency score (using 'zh' for Mandarin Chinese with best wordlist)
+    """
+    return word_frequency(hanzi, 'zh', wordlist='best')
+
+if __name__ == "__main__":
+    # Your list of entries (pinyin, traditional, meaning)
+    entries = [
+        ("lóng", "龍", "Drache"),
+        ("zhǎng", "長", "lang"),
+        ("zhōng", "中", "Mitte"),
+        ("guó", "國", "Land"),
+        ("rén", "人", "Person"),
+        ("yī", "一", "eins"),
+        ("yīng wǔ", "鸚鵡", "Papagei"),
+        ("shā fā", "沙發", "Sofa"),
+        ("xǐ wǎn chí", "洗碗池", "Spülbecken / Spüle"),
+        ("mǎ tǒng", "馬桶", "Toilette")
+    ]
+
+    # Add frequency scores
+    entries_with_freq = [
+        (pinyin, hanzi, meaning, get_frequency_score(hanzi))
+        for pinyin, hanzi, meaning in entries
+    ]
+
+    # Sort by frequency in descending order
+    sorted_entries = sorted(entries_with_freq, key=lambda x: x[3], reverse=True)
+
+    # Print results
+    for pinyin, hanzi, meaning, freq in sorted_entries:
+        print(f"{hanzi} ({pinyin}): {meaning} — freq: {freq:.6f}")
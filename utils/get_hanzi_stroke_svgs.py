@@ -1,3 +1,30 @@
+import os
+
+SVG_BASE_PATH = "makemeahanzi/svgs-still"
+
+# Codepoint -> SVG filename for every stroke SVG on disk, built on first use
+_svg_index = None
+
+def _get_svg_index() -> dict[int, str]:
+    """Index the stroke SVG directory once and reuse the result."""
+    global _svg_index
+    if _svg_index is None:
+        _svg_index = {}
+        try:
+            filenames = os.listdir(SVG_BASE_PATH)
+        except FileNotFoundError:
+            filenames = []
+        for filename in filenames:
+            codepoint, _, suffix = filename.partition('-')
+            if suffix == "still.svg" and codepoint.isdigit():
+                _svg_index[int(codepoint)] = filename
+    return _svg_index
+
 def get_hanzi_stroke_svgs(word: str) -> list[str]:
-    """Get a list of SVG filenames for each character in the word."""
-    return [f"{ord(char)}-still.svg" for char in word]
+    """Get a list of SVG filenames for each character in the word that has a stroke SVG."""
+    svg_index = _get_svg_index()
+    if not svg_index:
+        # SVG directory not available, fall back to the expected filenames
+        return list(map("{}-still.svg".format, map(ord, word)))
+    # Characters without an SVG look up None and are dropped by filter
+    return list(filter(None, map(svg_index.get, map(ord, word))))
@@ -1,7 +1,18 @@
-from pycccedict.cccedict import CcCedict
+from .add_translations import create_translation_map
 
-# Initialize the dictionary
-cccedict = CcCedict()
+# Every CC-CEDICT headword has at least one character from the CJK blocks,
+# which start at the CJK Radicals Supplement
+CJK_START = 0x2E80
+
+# Traditional and simplified headwords mapped to their definitions, built on first lookup
+_translation_map = None
+
+def _get_translation_map() -> dict:
+    """Return the headword index, building it (or loading its pickle) on first use."""
+    global _translation_map
+    if _translation_map is None:
+        _translation_map = create_translation_map()
+    return _translation_map
 
 def lookup(word: str) -> list[str]:
     """
@@ -13,23 +24,13 @@ def lookup(word: str) -> list[str]:
     Returns:
         list[str]: A list of English definitions for the word
     """
+    # Empty or non-Chinese input can't match a headword, skip the dictionary
+    if not word or max(map(ord, word)) < CJK_START:
+        return []
+
     try:
-        cedict = CcCedict()
-        entries = cedict.get_entries()
-        
-        # Find entries where either traditional or simplified matches our word
-        matching_entries = [
-            entry for entry in entries 
-            if entry['traditional'] == word or entry['simplified'] == word
-        ]
-        
-        # Collect all definitions from matching entries
-        all_definitions = []
-        for entry in matching_entries:
-            all_definitions.extend(entry['definitions'])
-            
-        return all_definitions
-        
+        # Copy the definitions so callers can modify their result freely
+        return list(_get_translation_map().get(word, ()))
     except Exception as e:
         print(f"Error looking up word: {e}")
         return []
@@ -0,0 +1,89 @@
+"""
+JSON helpers shared by the word loaders and the data preparation scripts.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, without it arrays are loaded whole
+    ijson = None
+
+# Raised for malformed input: json and orjson decode errors subclass ValueError,
+# ijson's do not
+JSON_DECODE_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+def load_json(json_path: str):
+    """
+    Load a JSON document from disk.
+
+    The file is read as raw bytes and handed to orjson when it is installed,
+    skipping the text decoding layer of the standard library parser.
+
+    Args:
+        json_path: Path to the JSON file
+
+    Returns:
+        The decoded JSON document
+    """
+    with open(json_path, 'rb') as f:
+        data = f.read()
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def iter_json_items(json_path: str):
+    """
+    Iterate over the items of a top-level JSON array.
+
+    With ijson installed the items are decoded one at a time, so a caller
+    that stops early never parses the rest of the file. Otherwise the whole
+    document is loaded and its items are yielded.
+
+    Args:
+        json_path: Path to a JSON file containing an array
+
+    Yields:
+        The decoded array items
+    """
+    if ijson is None:
+        yield from load_json(json_path)
+        return
+
+    with open(json_path, 'rb') as f:
+        # use_float keeps numbers as float instead of Decimal, like json.load
+        yield from ijson.items(f, 'item', use_float=True)
+
+def dump_json(data, json_path: str, pretty: bool = False):
+    """
+    Write a JSON document to disk as UTF-8.
+
+    The word lists are only read back by the scripts, so by default they are
+    written compactly, which keeps the files about half the size. orjson
+    encodes straight to UTF-8 bytes when it is installed; otherwise the
+    standard library writes the same layout with ensure_ascii disabled so the
+    Chinese text stays readable.
+
+    Args:
+        data: The JSON-serializable document
+        json_path: Path of the file to write
+        pretty: Indent the output by two spaces for reading by hand
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        if pretty:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
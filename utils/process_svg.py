@@ -1,57 +1,98 @@
-from bs4 import BeautifulSoup
+import functools
+import hashlib
+import os
+import re
+from lxml import etree
 
-def process_svg(svg_path: str) -> BeautifulSoup:
+# Processed SVGs are kept here between runs, keyed by SVG path and modification time
+CACHE_DIR = "output/cache"
+
+# Part of the disk cache key; bump it whenever _process_svg_tree changes its output
+PROCESS_SVG_VERSION = 1
+
+# Start point of a path: the "M x y" it opens with
+_MOVE_TO = re.compile(r'\s*M\s*(-?\d+(?:\.\d+)?)[\s,]+(-?\d+(?:\.\d+)?)')
+
+def _process_svg_tree(svg_path: str) -> etree._Element:
     """Process an SVG file by removing stroke numbers and adding gray background strokes."""
-    with open(svg_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "xml")
+    root = etree.parse(svg_path).getroot()
 
     # Remove all <text> elements (stroke numbers)
-    for text in soup.find_all("text"):
-        text.decompose()
+    for text in list(root.iter("{*}text")):
+        text.getparent().remove(text)
 
     # Find the group containing the strokes
-    stroke_group = soup.find('g', transform=lambda x: x and 'scale(1, -1)' in x)
+    stroke_groups = root.xpath(".//*[local-name()='g' and contains(@transform, 'scale(1, -1)')]")
 
-    if stroke_group:
+    if stroke_groups:
+        stroke_group = stroke_groups[0]
         # Create a new group for the gray background strokes
-        gray_group = soup.new_tag('g')
-        gray_group['transform'] = stroke_group['transform']
+        gray_group = etree.Element(stroke_group.tag)
+        gray_group.set('transform', stroke_group.get('transform'))
         
         # Copy each path and make it gray
-        original_paths = stroke_group.find_all("path")
+        original_paths = list(stroke_group.iter("{*}path"))
         num_strokes = len(original_paths)
         
         # Create gray background strokes
         for path in original_paths:
-            gray_path = soup.new_tag('path')
-            for attr, value in path.attrs.items():
-                gray_path[attr] = value
-            gray_path['fill'] = '#CCCCCC'
-            gray_path['style'] = 'fill:#CCCCCC'
-            gray_group.append(gray_path)
+            gray_path = etree.SubElement(gray_group, path.tag, attrib=dict(path.attrib))
+            gray_path.set('fill', '#CCCCCC')
+            gray_path.set('style', 'fill:#CCCCCC')
         
         # Insert the gray background before the colored strokes
-        stroke_group.insert_before(gray_group)
+        stroke_group.addprevious(gray_group)
         
-        # Helper function to extract coordinates from path data
-        def get_path_coords(d):
-            parts = d.strip().split()
-            if parts[0] == 'M':
-                return float(parts[1]), float(parts[2])
-            return None
-            
         # Process each path as a separate stroke
         for i, path in enumerate(original_paths, 1):
-            d = path.get('d', '')
-            coords = get_path_coords(d)
+            move_to = _MOVE_TO.match(path.get('d', ''))
             
-            if coords:
-                print(f"Processing stroke {i} at ({coords[0]}, {coords[1]})")
+            if move_to:
+                print(f"Processing stroke {i} at ({float(move_to.group(1))}, {float(move_to.group(2))})")
                 
-            path['fill'] = '#000000'
-            path['style'] = 'fill:#000000'
-            path['class'] = f'stroke-{i}'  # Each path is its own stroke
+            path.set('fill', '#000000')
+            path.set('style', 'fill:#000000')
+            path.set('class', f'stroke-{i}')  # Each path is its own stroke
     else:
         print(f"Warning: No stroke group found in {svg_path}")
 
-    return soup
+    return root
+
+@functools.lru_cache(maxsize=4096)
+def _process_svg_cached(svg_path: str, svg_mtime_ns: int) -> bytes:
+    """Return the processed SVG from the disk cache, processing and storing it on a miss."""
+    key = hashlib.sha1(f"{PROCESS_SVG_VERSION}:{os.path.abspath(svg_path)}:{svg_mtime_ns}".encode("utf-8")).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{key}.svg")
+    try:
+        with open(cache_path, "rb") as f:
+            return f.read()
+    except OSError:
+        pass  # Not processed yet
+    
+    svg_bytes = etree.tostring(_process_svg_tree(svg_path), encoding="utf-8", xml_declaration=True)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so an interrupted run never leaves a truncated cache
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(svg_bytes)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_path}: {e}")
+    return svg_bytes
+
+def process_svg(svg_path: str) -> bytes:
+    """
+    Process an SVG file by removing stroke numbers and adding gray background strokes.
+    
+    The result is cached in memory and on disk, so an SVG is only processed again
+    after it has been modified.
+    
+    Args:
+        svg_path: Path to the character's stroke SVG
+        
+    Returns:
+        The processed SVG document as UTF-8 bytes. Earlier versions returned a
+        BeautifulSoup object; parse the bytes with lxml.etree.fromstring for a tree.
+    """
+    return _process_svg_cached(svg_path, os.stat(svg_path).st_mtime_ns)
@@ -0,0 +1,129 @@
+import atexit
+import os
+import subprocess
+from typing import Iterable, Tuple
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # cairosvg is optional (and needs the cairo library), fall back to Inkscape
+    cairosvg = None
+
+# Inkscape prints this prompt at the start of a line whenever it waits for commands
+_PROMPT = "> "
+
+# Long-lived `inkscape --shell` process shared by all renders in this process
+_inkscape_proc = None
+
+def _wait_for_prompt(proc: subprocess.Popen) -> None:
+    """Read the shell output until Inkscape asks for the next command."""
+    line = ""
+    while True:
+        char = proc.stdout.read(1)
+        if not char:
+            raise RuntimeError("Inkscape shell exited unexpectedly")
+        line = "" if char == "\n" else line + char
+        if line == _PROMPT:
+            return
+
+def _close_inkscape_shell() -> None:
+    """Stop the shared Inkscape shell, if one was started."""
+    global _inkscape_proc
+    if _inkscape_proc is None:
+        return
+    try:
+        if _inkscape_proc.poll() is None:
+            _inkscape_proc.stdin.write("quit\n")
+            _inkscape_proc.stdin.close()
+            _inkscape_proc.wait(timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        _inkscape_proc.kill()
+    _inkscape_proc = None
+
+def _get_inkscape_shell() -> subprocess.Popen:
+    """Return the shared Inkscape shell, starting it on first use."""
+    global _inkscape_proc
+    if _inkscape_proc is None or _inkscape_proc.poll() is not None:
+        _inkscape_proc = subprocess.Popen(
+            ["inkscape", "--shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+        _wait_for_prompt(_inkscape_proc)
+    return _inkscape_proc
+
+atexit.register(_close_inkscape_shell)
+
+def _shell_path(path: str) -> str:
+    """Return the absolute path for an Inkscape shell command, rejecting paths the shell would split."""
+    path = os.path.abspath(path)
+    # Actions are separated by ';' and commands by newlines, and the shell has no quoting
+    if any(char in path for char in ";\r\n"):
+        raise ValueError(f"Cannot pass a path containing ';' or a line break to Inkscape: {path!r}")
+    return path
+
+def render_svgs_to_png(jobs: Iterable[Tuple[str, str]], width: int = 300) -> None:
+    """
+    Render several SVG files to PNG with one batch of Inkscape shell commands.
+    
+    The commands for every file are written to the shell at once and the prompts are
+    collected afterwards, so the shell never sits idle waiting for the next command.
+    When cairosvg is installed the files are rasterized in-process instead.
+    
+    Args:
+        jobs: (SVG path, PNG path) pairs to render
+        width: Width of the exported PNGs in pixels
+    """
+    if cairosvg is not None:
+        # Rasterize in this process, no Inkscape needed
+        for svg_path, png_path in jobs:
+            cairosvg.svg2png(url=svg_path, write_to=png_path, output_width=width)
+        return
+
+    png_paths = []
+    commands = []
+    for svg_path, png_path in jobs:
+        svg_path = _shell_path(svg_path)
+        png_path = _shell_path(png_path)
+        png_paths.append(png_path)
+        commands.append(
+            f"file-open:{svg_path}; export-type:png; export-width:{width}; "
+            f"export-filename:{png_path}; export-do; file-close\n"
+        )
+    if not commands:
+        return
+
+    # The shell prompts again even when an export fails, so remove the old PNGs
+    # first; a PNG that is missing afterwards was not rendered
+    for png_path in png_paths:
+        try:
+            os.remove(png_path)
+        except FileNotFoundError:
+            pass
+
+    proc = _get_inkscape_shell()
+    proc.stdin.write("".join(commands))
+    proc.stdin.flush()
+    # Inkscape answers every command line with a new prompt
+    for _ in commands:
+        _wait_for_prompt(proc)
+
+    for png_path in png_paths:
+        if not os.path.exists(png_path):
+            raise RuntimeError(f"Inkscape did not render {png_path}")
+
+def render_svg_to_png(svg_path: str, png_path: str, width: int = 300) -> None:
+    """
+    Render an SVG file to PNG with cairosvg or Inkscape.
+    
+    Without cairosvg, all renders go through one persistent `inkscape --shell` process,
+    so Inkscape's startup cost is paid once per program run instead of once per PNG.
+    
+    Args:
+        svg_path: Path to the SVG file to render
+        png_path: Path of the PNG file to write
+        width: Width of the exported PNG in pixels
+    """
+    render_svgs_to_png([(svg_path, png_path)], width=width)
@@ -1,23 +1,30 @@
 #!/usr/bin/env python3
-import json
 import argparse
 import os
 import sys
-from typing import List, Dict, Callable
-import unicodedata
+import pickle
+from typing import List, Dict, Iterable
 from collections import Counter
 
 # Add parent directory to path so we can import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utils.json_io import load_json, iter_json_items, JSON_DECODE_ERRORS
 from utils.filters import (
     filter_by_level,
     filter_by_grammar,
     filter_by_text,
     filter_by_translation,
-    filter_by_multiple_levels,
+    contains_text,
+    has_translation_matching,
+    has_grammar,
+    has_lowest_level,
     appears_in_level,
+    appears_in_min_levels,
     apply_filters,
+    normalize_pinyin,  # Defined here before it moved to filters; kept importable from this module
+    prepare_pinyin_index,
+    prepare_filter_index,
     sort_by_pinyin,
     sort_by_stroke_count,
     sort_by_frequency,
@@ -25,23 +32,73 @@ from utils.filters import (
     apply_sort
 )
 
-def normalize_pinyin(text: str) -> str:
-    """Remove tone marks from pinyin."""
-    return ''.join(char for char in unicodedata.normalize('NFD', text)
-                  if unicodedata.category(char) != 'Mn')
+# Version of the prepared words stored by load_words_cached; bump it whenever load_words
+# changes what it adds to the words (normalized pinyin, interned fields, ...)
+WORDS_CACHE_VERSION = 2
+
+def _intern_categories(words: List[Dict]) -> List[Dict]:
+    """
+    Replace the level and grammar strings of each word with interned copies.
+    
+    These fields only take a handful of distinct values, so after interning
+    all words share the same string objects and the comparisons and Counter
+    lookups on them hit the identity fast path.
+    """
+    intern = sys.intern
+    for word in words:
+        # Missing or null fields are left as they are, only strings can be interned
+        for key in ('lowest_level', 'grammar'):
+            value = word.get(key)
+            if isinstance(value, str):
+                word[key] = intern(value)
+        levels = word.get('levels')
+        if isinstance(levels, list):
+            word['levels'] = [intern(level) if isinstance(level, str) else level for level in levels]
+    return words
 
 def load_words(json_path: str) -> List[Dict]:
-    """Load words from JSON file."""
+    """Load words from JSON file, with their normalized pinyin and translation index precomputed for searching."""
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        words = _intern_categories(load_json(json_path))
+        return prepare_filter_index(prepare_pinyin_index(words))
     except FileNotFoundError:
         print(f"Error: Could not find file {json_path}")
         return []
-    except json.JSONDecodeError:
+    except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
         print(f"Error: File {json_path} is not valid JSON")
         return []
 
+def load_words_cached(json_path: str) -> List[Dict]:
+    """
+    Load words from JSON file, reusing a pickled copy when it is up to date.
+    
+    The pickle is kept next to the JSON file and rebuilt whenever the JSON
+    file has been modified after it was written, or when it was written by a
+    version of load_words that prepared the words differently.
+    """
+    cache_path = json_path + '.cache.pkl'
+    try:
+        if os.stat(cache_path).st_mtime_ns >= os.stat(json_path).st_mtime_ns:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            # Caches from before the version was stored are plain lists and are rebuilt too
+            if isinstance(cached, dict) and cached.get('version') == WORDS_CACHE_VERSION:
+                return cached['words']
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass  # Missing or unreadable cache, parse the JSON file instead
+    
+    words = load_words(json_path)
+    if words:
+        try:
+            # Write to a temporary file first so an interrupted run never leaves a truncated cache
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'version': WORDS_CACHE_VERSION, 'words': words}, f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write cache {cache_path}: {e}")
+    return words
+
 def search_words(words: List[Dict], query: str, search_type: str = 'chinese', exact: bool = False) -> List[Dict]:
     """
     Search for words based on query and search type.
@@ -68,48 +125,74 @@ def search_words(words: List[Dict], query: str, search_type: str = 'chinese', ex
     
     return []
 
+# Display layout of a single word, filled in by format_word
+_WORD_TEMPLATE = ("Chinese: {}\n"
+                  "Pinyin: {}\n"
+                  "Grammar: {}\n"
+                  "Level: {}\n"
+                  "All levels: {}\n"
+                  "Frequency score: {}\n"
+                  "Translations: {}")
+
 def format_word(word: Dict) -> str:
     """Format a word dictionary for display."""
-    translations = word.get('translations', [])
-    if not translations:
-        translations_str = "No translations available"
-    else:
-        translations_str = '; '.join(translations)
-    
-    frequency = word.get('frequency_score', 'N/A')
-    return (f"Chinese: {word['chineseword']}\n"
-            f"Pinyin: {word['pinyin']}\n"
-            f"Grammar: {word['grammar']}\n"
-            f"Level: {word.get('lowest_level', '')}\n"
-            f"All levels: {', '.join(word.get('levels', []))}\n"
-            f"Frequency score: {frequency}\n"
-            f"Translations: {translations_str}")
+    translations = word.get('translations')
+    translations_str = '; '.join(translations) if translations else "No translations available"
+    return _WORD_TEMPLATE.format(word['chineseword'],
+                                 word['pinyin'],
+                                 word['grammar'],
+                                 word.get('lowest_level', ''),
+                                 ', '.join(word.get('levels', ())),
+                                 word.get('frequency_score', 'N/A'),
+                                 translations_str)
 
-def print_statistics(results: List[Dict]):
-    """Print statistics about search results."""
-    print(f"\nTotal matches found: {len(results)}")
+def print_statistics(results: Iterable[Dict]):
+    """
+    Print statistics about search results.
+    
+    The results are only iterated once, so they can also be streamed
+    straight from the word file.
+    """
+    # Count levels, grammar and multi-level words in a single pass
+    total = 0
+    level_counts = Counter()
+    grammar_counts = Counter()
+    multi_level = 0
+    for word in results:
+        total += 1
+        level_counts[word['lowest_level']] += 1
+        grammar_counts[word['grammar']] += 1
+        if len(word.get('levels', ())) > 1:
+            multi_level += 1
+    
+    print(f"\nTotal matches found: {total}")
     
-    # Count by lowest level
-    level_counts = Counter(word['lowest_level'] for word in results)
     print("\nDistribution by lowest level:")
     for level in ['beginner', 'intermediate', 'advanced']:
         count = level_counts.get(level, 0)
-        percentage = (count / len(results) * 100) if results else 0
+        percentage = (count / total * 100) if total else 0
         print(f"  {level.capitalize()}: {count} ({percentage:.1f}%)")
     
-    # Count by grammar
-    grammar_counts = Counter(word['grammar'] for word in results)
     if grammar_counts:
         print("\nDistribution by grammar:")
         for grammar, count in sorted(grammar_counts.items()):
-            percentage = (count / len(results) * 100)
+            percentage = (count / total * 100)
             print(f"  {grammar}: {count} ({percentage:.1f}%)")
     
-    # Count words appearing in multiple levels
-    multi_level = sum(1 for word in results if len(word.get('levels', [])) > 1)
     if multi_level:
         print(f"\nWords appearing in multiple levels: {multi_level}")
 
+# (argument, filename label) pairs of the search filters, in filename order
+_FILENAME_FIELDS = (
+    ('pinyin', 'pinyin'),
+    ('character', 'character'),
+    ('translation', 'translation'),
+    ('grammar', 'grammar'),
+    ('level', 'level'),
+    ('appears_in', 'appears_in'),
+    ('min_levels', 'min_levels'),
+)
+
 def generate_default_filename(args: argparse.Namespace) -> str:
     """
     Generate a descriptive default filename based on the filters and cutoff.
@@ -120,23 +203,9 @@ def generate_default_filename(args: argparse.Namespace) -> str:
     Returns:
         Descriptive filename without extension
     """
-    parts = []
-    
     # Add search filters
-    if args.pinyin:
-        parts.append(f"pinyin_{args.pinyin}")
-    if args.character:
-        parts.append(f"character_{args.character}")
-    if args.translation:
-        parts.append(f"translation_{args.translation}")
-    if args.grammar:
-        parts.append(f"grammar_{args.grammar}")
-    if args.level:
-        parts.append(f"level_{args.level}")
-    if args.appears_in:
-        parts.append(f"appears_in_{args.appears_in}")
-    if args.min_levels:
-        parts.append(f"min_levels_{args.min_levels}")
+    parts = [f"{label}_{getattr(args, name)}" for name, label in _FILENAME_FIELDS
+             if getattr(args, name)]
         
     # Add exact flag if used
     if args.exact:
@@ -181,40 +250,51 @@ def main():
     # Construct path to JSON file
     json_path = os.path.join(current_dir, '..', args.json)
     
-    # Load words
-    words = load_words(json_path)
-    if not words:
-        return
-    
-    # Build list of filters
+    # Build list of filters; apply_filters stops at the first predicate a word fails,
+    # so the cheap field comparisons go before the substring searches
     filters = []
     
-    # Add text-based filters
-    if args.pinyin:
-        filters.append(lambda words: filter_by_text(words, 'pinyin', args.pinyin, normalize=not args.exact))
-    if args.character:
-        filters.append(lambda words: filter_by_text(words, 'chineseword', args.character))
-    if args.translation:
-        filters.append(lambda words: filter_by_translation(words, args.translation, exact=args.exact))
-        
-    # Add grammar filter
-    if args.grammar:
-        filters.append(lambda w: filter_by_grammar(w, args.grammar))
-        
     # Add level-based filters
     if args.level:
-        filters.append(lambda w: filter_by_level(w, args.level))
+        filters.append(has_lowest_level(args.level))
     if args.appears_in:
         filters.append(appears_in_level(args.appears_in))
     if args.min_levels:
-        filters.append(lambda w: filter_by_multiple_levels(w, args.min_levels))
+        filters.append(appears_in_min_levels(args.min_levels))
+        
+    # Add grammar filter
+    if args.grammar:
+        filters.append(has_grammar(args.grammar))
+        
+    # Add text-based filters
+    if args.character:
+        filters.append(contains_text('chineseword', args.character))
+    if args.pinyin:
+        filters.append(contains_text('pinyin', args.pinyin, normalize=not args.exact))
+    if args.translation:
+        filters.append(has_translation_matching(args.translation, exact=args.exact))
+    
+    # Statistics over the whole list only need one streamed pass over the file
+    if args.count and not filters:
+        try:
+            print_statistics(iter_json_items(json_path))
+        except FileNotFoundError:
+            print(f"Error: Could not find file {json_path}")
+        except JSON_DECODE_ERRORS:
+            print(f"Error: File {json_path} is not valid JSON")
+        return
+    
+    # Load words
+    words = load_words_cached(json_path)
+    if not words:
+        return
     
     # Apply all filters
     if filters:
         words = apply_filters(words, filters)
     
-    # Apply sorting if specified
-    if args.sort:
+    # Apply sorting if specified; the statistics do not depend on the order, so --count skips it
+    if args.sort and not args.count:
         sort_funcs = {
             'pinyin': sort_by_pinyin,
             'stroke': sort_by_stroke_count,
@@ -228,10 +308,12 @@ def main():
         if args.count:
             print_statistics(words)
         else:
+            # Format every word once, the same text goes to the screen and to the file
+            separator = "\n" + "-" * 40 + "\n"
+            results_text = "".join([format_word(word) + separator for word in words])
+            
             print(f"\nFound {len(words)} matching words:\n")
-            for word in words:
-                print(format_word(word))
-                print("-" * 40)
+            sys.stdout.write(results_text)
             print("\nAdd --count to see statistics about the results.")
             
             # Save results to file if output is specified
@@ -241,10 +323,7 @@ def main():
                 output_file = f"{generate_default_filename(args)}.txt"
                 
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"Found {len(words)} matching words:\n\n")
-                for word in words:
-                    f.write(format_word(word))
-                    f.write("\n" + "-" * 40 + "\n")
+                f.write(f"Found {len(words)} matching words:\n\n{results_text}")
             print(f"\nResults saved to {output_file}")
     else:
         print("\nNo words found matching the specified criteria.")
@@ -1,3 +1,4 @@
+from operator import itemgetter
 from utils.get_frequency_score import get_frequency_score
 
 def sort_characters_by_frequency(characters: str) -> list[tuple[str, int]]:
@@ -10,11 +11,12 @@ def sort_characters_by_frequency(characters: str) -> list[tuple[str, int]]:
     Returns:
         A list of tuples containing (character, frequency_score) sorted by frequency (highest first)
     """
-    # Get frequency scores for each character
-    char_scores = [(char, get_frequency_score(char)) for char in characters]
+    # Get frequency scores once per distinct character
+    scores = {char: get_frequency_score(char) for char in set(characters)}
+    char_scores = [(char, scores[char]) for char in characters]
     
     # Sort by frequency score in descending order
-    sorted_chars = sorted(char_scores, key=lambda x: x[1], reverse=True)
+    sorted_chars = sorted(char_scores, key=itemgetter(1), reverse=True)
     
     return sorted_chars
 
@@ -1,19 +1,133 @@
+import hashlib
 import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, TextIO, Tuple, Union
 
-def write_latex_to_pdf(tex_code: str, output_basename: str):
-    """Write LaTeX code to a file and compile it to PDF."""
-    output_dir = "output/pngs"  # Keep the same output directory as original
-    tex_file = os.path.join(output_dir, f"{output_basename}.tex")
+# Directory (inside the output directory) holding the source hashes of previous builds
+LATEX_CACHE_DIR = "latex_cache"
 
-    with open(tex_file, "w", encoding="utf-8") as f:
-        f.write(tex_code)
+# Directory the .tex sources are written to and compiled in
+OUTPUT_DIR = "output/pngs"  # Keep the same output directory as original
 
-    subprocess.run(
-        ["xelatex", "-interaction=nonstopmode", f"{output_basename}.tex"],
-        cwd=output_dir,
+# Graphics the document pulls in, their files are part of the build input
+_INCLUDED_GRAPHICS = re.compile(rb"\\includegraphics(?:\[[^\]]*\])?\{([^}]+)\}")
+
+def _build_sha256(tex_file: str) -> str:
+    """
+    Return a SHA-256 hex digest of everything a build of the .tex file depends on.
+    
+    The source only names the stroke PNGs, so a re-rendered PNG leaves it
+    byte-identical. The size and modification time of every included image
+    are hashed along with the source, so such a change still triggers a rebuild.
+    """
+    with open(tex_file, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source)
+    for name in sorted(set(_INCLUDED_GRAPHICS.findall(source))):
+        try:
+            stat = os.stat(os.path.join(OUTPUT_DIR, os.fsdecode(name)))
+            digest.update(b"\0%s\0%d\0%d" % (name, stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            digest.update(b"\0%s\0missing" % name)
+    return digest.hexdigest()
+
+def _write_tex(tex_code: Union[str, Callable[[TextIO], None]], output_basename: str) -> str:
+    """Write the LaTeX source to the output directory and return the path of the .tex file."""
+    tex_file = os.path.join(OUTPUT_DIR, f"{output_basename}.tex")
+
+    if callable(tex_code):
+        with open(tex_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+            tex_code(f)
+    else:
+        # Encode the finished document once and write the bytes in a single call
+        with open(tex_file, "wb") as f:
+            f.write(tex_code.encode("utf-8"))
+    return tex_file
+
+def _compile_tex(output_basename: str, syntax_check: bool, tex_hash: Optional[str]) -> None:
+    """Run xelatex on a written .tex file and report the result."""
+    tex_file = os.path.join(OUTPUT_DIR, f"{output_basename}.tex")
+    pdf_file = os.path.join(OUTPUT_DIR, f"{output_basename}.pdf")
+
+    command = ["xelatex", "-interaction=nonstopmode"]
+    if syntax_check:
+        # Stop at the first error and skip the PDF backend entirely
+        command += ["-no-pdf", "-halt-on-error"]
+    command.append(f"{output_basename}.tex")
+
+    result = subprocess.run(
+        command,
+        cwd=OUTPUT_DIR,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
 
-    print(f"✅ PDF generated: {os.path.join(output_dir, f'{output_basename}.pdf')}") 
\ No newline at end of file
+    if syntax_check:
+        if result.returncode == 0:
+            print(f"✅ LaTeX syntax check passed: {tex_file}")
+        else:
+            print(f"❌ LaTeX syntax check failed, see {os.path.join(OUTPUT_DIR, f'{output_basename}.log')}")
+        return
+
+    # Remember the source of a successful build so an identical rebuild can be skipped
+    if result.returncode == 0:
+        hash_file = os.path.join(OUTPUT_DIR, LATEX_CACHE_DIR, f"{output_basename}.sha256")
+        os.makedirs(os.path.dirname(hash_file), exist_ok=True)
+        with open(hash_file, "w", encoding="utf-8") as f:
+            f.write(tex_hash)
+
+    print(f"✅ PDF generated: {pdf_file}")
+
+def write_latex_to_pdfs(documents: Iterable[Tuple[Union[str, Callable[[TextIO], None]], str]],
+                        syntax_check: bool = False, max_workers: Optional[int] = None) -> None:
+    """
+    Write several LaTeX documents and compile them to PDF in parallel.
+
+    All sources are written first, then up to max_workers xelatex processes run
+    at once. Documents whose PDF was already built from the same source and
+    images are skipped.
+
+    Args:
+        documents: (tex_code, output_basename) pairs, see write_latex_to_pdf
+        syntax_check: Only check the documents for errors, without producing PDFs
+        max_workers: Maximum number of concurrent xelatex runs (default: number of CPUs)
+    """
+    builds = []
+    for tex_code, output_basename in documents:
+        tex_file = _write_tex(tex_code, output_basename)
+
+        # Skip xelatex when the PDF was already built from exactly this source and these images
+        tex_hash = None
+        if not syntax_check:
+            pdf_file = os.path.join(OUTPUT_DIR, f"{output_basename}.pdf")
+            hash_file = os.path.join(OUTPUT_DIR, LATEX_CACHE_DIR, f"{output_basename}.sha256")
+            tex_hash = _build_sha256(tex_file)
+            if os.path.exists(pdf_file) and os.path.exists(hash_file):
+                with open(hash_file, "r", encoding="utf-8") as f:
+                    if f.read().strip() == tex_hash:
+                        print(f"⏩ Skipping: {pdf_file} (LaTeX source and images unchanged)")
+                        continue
+        builds.append((output_basename, tex_hash))
+
+    if len(builds) == 1:
+        # A single document needs no thread pool
+        _compile_tex(builds[0][0], syntax_check, builds[0][1])
+        return
+
+    # xelatex runs in its own process, so threads are enough to keep several busy
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        # Consume the results so an error in any build is raised here
+        list(executor.map(lambda build: _compile_tex(build[0], syntax_check, build[1]), builds))
+
+def write_latex_to_pdf(tex_code: Union[str, Callable[[TextIO], None]], output_basename: str, syntax_check: bool = False):
+    """
+    Write LaTeX code to a file and compile it to PDF.
+
+    Args:
+        tex_code: The LaTeX source, or a callable that writes the source to the open .tex file
+        output_basename: Base name of the .tex and .pdf files
+        syntax_check: Only check the document for errors, without producing a PDF
+    """
+    write_latex_to_pdfs([(tex_code, output_basename)], syntax_check)